@@ -1,11 +1,15 @@
 import asyncio
+import functools
 import json
 import logging
 import random
 import re
 from typing import Any, Dict, List, Literal, Optional, Set
 
+import orjson
 from google.adk import Agent, Runner
+from google.adk.agents.context_cache_config import ContextCacheConfig
+from google.adk.apps import App
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.genai import types
 from pydantic import BaseModel, Field
@@ -78,10 +82,20 @@ class PenguinAnalyzer:
     The model decides intent directly from user request + optional scene context.
     """
 
-    def __init__(self, model_name: str = "gemini-2.0-flash"):
+    # Lifetime of a cached system-instruction prefix on the provider side
+    CONTEXT_CACHE_TTL_SECONDS = 300
+
+    def __init__(
+        self, model_name: str = "gemini-2.0-flash", context_cache: bool = False
+    ):
         self.model_name = model_name
         self.session_service = InMemorySessionService()
         self.max_llm_retries = 2
+        self.context_cache_config = (
+            ContextCacheConfig(ttl_seconds=self.CONTEXT_CACHE_TTL_SECONDS)
+            if context_cache
+            else None
+        )
 
     _LOCATION_OPTIONS = [
         "center",
@@ -131,9 +145,19 @@ class PenguinAnalyzer:
         "action",
     ]
     _HEX_COLOR_RE = re.compile(r"#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})")
+    _RATE_LIMIT_RE = re.compile(
+        r"resource_exhausted|rate limit|too many requests|status code 429|error code-429",
+        re.IGNORECASE,
+    )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_system_instruction() -> str:
+        """
+        Build a single prompt that handles both generation and refinement.
 
-    def _get_system_instruction(self) -> str:
-        """Build a single prompt that handles both generation and refinement."""
+        The tool registry is static, so the prompt is built once per process.
+        """
         schemas = ToolRegistry.get_all_schemas()
 
         tool_lines: List[str] = []
@@ -353,7 +377,7 @@ Return EXACT schema:
         if start != -1 and end != -1 and end > start:
             cleaned = cleaned[start : end + 1]
 
-        return json.loads(cleaned)
+        return orjson.loads(cleaned)
 
     @staticmethod
     def _is_rate_limited_error(exc: Exception) -> bool:
@@ -367,17 +391,7 @@ Return EXACT schema:
             if status_code == 429:
                 return True
 
-            message = str(current).lower()
-            if any(
-                token in message
-                for token in (
-                    "resource_exhausted",
-                    "rate limit",
-                    "too many requests",
-                    "status code 429",
-                    "error code-429",
-                )
-            ):
+            if PenguinAnalyzer._RATE_LIMIT_RE.search(str(current)):
                 return True
 
             current = getattr(current, "__cause__", None) or getattr(
@@ -386,6 +400,32 @@ Return EXACT schema:
 
         return False
 
+    def _build_runner(self, agent: Agent) -> Runner:
+        """
+        Build a runner for one agent call.
+
+        With context caching enabled the agent is wrapped in an App so ADK can
+        reuse the provider-side cache for the stable system instruction.
+        """
+        if self.context_cache_config is None:
+            return Runner(
+                app_name="PenguinAgentic",
+                agent=agent,
+                session_service=self.session_service,
+                auto_create_session=True,
+            )
+
+        app = App(
+            name="PenguinAgentic",
+            root_agent=agent,
+            context_cache_config=self.context_cache_config,
+        )
+        return Runner(
+            app=app,
+            session_service=self.session_service,
+            auto_create_session=True,
+        )
+
     async def _run_agent_for_text(
         self,
         *,
@@ -820,12 +860,7 @@ Return EXACT schema:
             model=self.model_name,
             instruction=self._get_generation_polisher_instruction(),
         )
-        runner = Runner(
-            app_name="PenguinAgentic",
-            agent=agent,
-            session_service=self.session_service,
-            auto_create_session=True,
-        )
+        runner = self._build_runner(agent)
 
         try:
             final_text = await self._run_agent_for_text(
@@ -863,12 +898,7 @@ Return EXACT schema:
             model=self.model_name,
             instruction=self._get_system_instruction(),
         )
-        runner = Runner(
-            app_name="PenguinAgentic",
-            agent=agent,
-            session_service=self.session_service,
-            auto_create_session=True,
-        )
+        runner = self._build_runner(agent)
 
         try:
             final_text = await self._run_agent_for_text(
@@ -6,6 +6,7 @@ from app.services.file_service import FileService
 from app.services.segmentation_service import SegmentationService
 from app.services.websocket_manager import WebSocketManager
 from app.services.agent_memory_service import AgentMemoryService
+from app.agentic.analyzer import PenguinAnalyzer
 from app.agentic.orchestrator import PenguinOrchestrator
 from app.services.bria_service import cleanup_bria_service
 
@@ -27,6 +28,8 @@ def get_sam3_model() -> SAM3Model:
             box_threshold=settings.box_threshold,
             text_threshold=settings.text_threshold,
             iou_threshold=settings.iou_threshold,
+            compile_model=settings.compile_model,
+            mixed_precision=settings.mixed_precision,
         )
     return _sam3_model
 
@@ -74,6 +77,7 @@ def get_orchestrator() -> PenguinOrchestrator:
     global _orchestrator
     if _orchestrator is None:
         _orchestrator = PenguinOrchestrator(
+            analyzer=PenguinAnalyzer(context_cache=settings.llm_prompt_cache_enabled),
             segmentation_service=get_segmentation_service(),
             memory_service=get_agent_memory_service(),
         )
@@ -91,6 +95,10 @@ async def cleanup_dependencies() -> None:
             await _ws_manager.disconnect(client_id)
         logger.info("WebSocket connections closed")
 
+    if _segmentation_service is not None:
+        _segmentation_service.shutdown()
+        logger.info("Segmentation worker threads stopped")
+
     _sam3_model = None
     _file_service = None
     _segmentation_service = None
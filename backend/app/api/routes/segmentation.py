@@ -1,4 +1,6 @@
 import json
+import os
+import stat
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -55,23 +57,49 @@ def _get_secure_result_dir(file_service: FileService, result_id: str) -> Path:
     return result_dir
 
 
+LIBRARY_FILE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".json"})
+
+
 def _build_file_node(
-    path: Path, base_url: str, parent_path: str, name: Optional[str] = None
+    path: Path,
+    base_url: str,
+    parent_path: str,
+    name: Optional[str] = None,
+    path_stat: Optional[os.stat_result] = None,
 ) -> FileNode:
-    stat = path.stat()
+    """
+    Build a library node for ``path``.
+
+    Directories are walked with ``os.scandir`` so entry types come from the
+    directory listing and each child is stat'ed exactly once, with the result
+    handed down instead of re-queried.
+    """
+    path_stat = path_stat or path.stat()
     node_path = _format_path(parent_path, name or path.name)
 
-    if path.is_dir():
+    if stat.S_ISDIR(path_stat.st_mode):
         children = []
-        for child in path.iterdir():
-            if child.is_dir():
-                children.append(
-                    _build_file_node(child, f"{base_url}/{child.name}", node_path)
-                )
-            elif child.suffix.lower() in {".png", ".jpg", ".jpeg", ".json"}:
-                children.append(
-                    _build_file_node(child, base_url, node_path, child.name)
-                )
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    children.append(
+                        _build_file_node(
+                            Path(entry.path),
+                            f"{base_url}/{entry.name}",
+                            node_path,
+                            path_stat=entry.stat(),
+                        )
+                    )
+                elif os.path.splitext(entry.name)[1].lower() in LIBRARY_FILE_EXTENSIONS:
+                    children.append(
+                        _build_file_node(
+                            Path(entry.path),
+                            base_url,
+                            node_path,
+                            entry.name,
+                            path_stat=entry.stat(),
+                        )
+                    )
 
         # Sort directories first, then files by modified date descending
         children.sort(
@@ -90,7 +118,7 @@ def _build_file_node(
             path=node_path,
             type="directory",
             children=children,
-            modified_at=datetime.fromtimestamp(stat.st_mtime),
+            modified_at=datetime.fromtimestamp(path_stat.st_mtime),
         )
 
     return FileNode(
@@ -98,8 +126,8 @@ def _build_file_node(
         path=node_path,
         type="file",
         extension=path.suffix.lstrip(".").lower() or None,
-        modified_at=datetime.fromtimestamp(stat.st_mtime),
-        size=stat.st_size if stat else None,
+        modified_at=datetime.fromtimestamp(path_stat.st_mtime),
+        size=path_stat.st_size,
         url=f"{base_url}/{path.name}",
     )
 
@@ -123,16 +151,18 @@ def _build_library_tree(file_service: FileService) -> FileNode:
         results_dir = file_service.outputs_dir
         if results_dir.exists():
             children = []
-            for result_dir in results_dir.iterdir():
-                if not result_dir.is_dir():
-                    continue
-                result_node = _build_file_node(
-                    result_dir,
-                    f"/outputs/{result_dir.name}",
-                    "/results",
-                    name=result_dir.name,
-                )
-                children.append(result_node)
+            with os.scandir(results_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    result_node = _build_file_node(
+                        Path(entry.path),
+                        f"/outputs/{entry.name}",
+                        "/results",
+                        name=entry.name,
+                        path_stat=entry.stat(),
+                    )
+                    children.append(result_node)
 
             children.sort(
                 key=lambda n: n.modified_at or datetime.min,
@@ -202,19 +232,22 @@ async def segment_image(
                 },
             )
 
-        image_content = await image.read()
-        if not FileValidation.validate_file_size(len(image_content)):
+        # Multipart parsing already counted the bytes; only read the upload
+        # to measure it when the size is unknown.
+        image_size = image.size
+        if image_size is None:
+            image_size = len(await image.read())
+            await image.seek(0)
+        if not FileValidation.validate_file_size(image_size):
             raise ValidationException(
                 "Image file size exceeds maximum allowed size",
                 details={
-                    "file_size_bytes": len(image_content),
+                    "file_size_bytes": image_size,
                     "max_size_bytes": FileValidation.MAX_FILE_SIZE_BYTES,
                     "max_size_mb": FileValidation.MAX_FILE_SIZE_BYTES / (1024 * 1024),
                 },
             )
 
-        await image.seek(0)
-
         if metadata:
             if metadata.content_type != "application/json":
                 raise ValidationException(
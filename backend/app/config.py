@@ -43,6 +43,14 @@ class Settings(BaseSettings):
     iou_threshold: float = Field(
         default=0.45, description="IOU threshold for SAM3 model"
     )
+    compile_model: bool = Field(
+        default=False,
+        description="Compile the SAM3 vision backbone with torch.compile",
+    )
+    mixed_precision: bool = Field(
+        default=False,
+        description="Run SAM3 under bf16/fp16 autocast on CUDA devices",
+    )
 
     uploads_dir: Path = Field(default=Path("uploads"), description="Uploads directory")
     outputs_dir: Path = Field(default=Path("outputs"), description="Outputs directory")
@@ -58,6 +66,10 @@ class Settings(BaseSettings):
         default=24, description="Age in hours before cleaning up old results"
     )
 
+    debug: bool = Field(
+        default=False,
+        description="Expose tracebacks in 500 responses and log local variables",
+    )
     log_level: str = Field(default="INFO", description="Logging level")
     log_format: Literal["json", "text"] = Field(
         default="text", description="Logging format (json or text)"
@@ -72,6 +84,10 @@ class Settings(BaseSettings):
     google_api_key: Optional[str] = Field(
         default=None, description="Google AI API key for Gemini/ADK"
     )
+    llm_prompt_cache_enabled: bool = Field(
+        default=False,
+        description="Reuse Gemini context caches for the analyzer system instruction",
+    )
 
 
 settings = Settings()
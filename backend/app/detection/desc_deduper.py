@@ -1,8 +1,11 @@
 import re
-from typing import List, Optional, Any
+from typing import Any, ClassVar, List, Optional, Set
 from dataclasses import dataclass, field
 import numpy as np
 
+# Content tokens are maximal runs of ASCII letters/digits after lowercasing
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
 
 @dataclass
 class DescriptorDeduper:
@@ -16,6 +19,10 @@ class DescriptorDeduper:
         treat it as a near-duplicate and drop it (or keep the "better" one).
     """
 
+    # Batches at least this large compare tokens as one matrix product; below
+    # it, NumPy setup costs more than the pairwise set operations it replaces.
+    MATRIX_MIN_PHRASES: ClassVar[int] = 64
+
     # Threshold for token-set overlap [0,1].
     token_jaccard_thresh: float = 0.6
 
@@ -35,20 +42,15 @@ class DescriptorDeduper:
         """
         Normalize phrase into a list of content tokens:
         - lower case
-        - remove non-alphanumeirc chars
-        - split on whitespace
+        - split into runs of ASCII letters/digits (everything else separates)
         - drop short/stopword tokens
         """
-
-        s = phrase.lower()
-        # Replace non-alphanumeric chars with spaces
-        s = re.sub(r"[^a-z0-9\s]", " ", s)
-        # Collapse multiple spaces
-        s = re.sub(r"\s+", " ", s).strip()
-        tokens = s.split()
-        tokens = [t for t in tokens if len(t) > 1 and t not in self.stopwords]
-
-        return tokens
+        stopwords = self.stopwords
+        return [
+            t
+            for t in _TOKEN_RE.findall(phrase.lower())
+            if len(t) > 1 and t not in stopwords
+        ]
 
     def _jaccard(self, a: List[str], b: List[str]) -> float:
         if not a or not b:
@@ -60,16 +62,54 @@ class DescriptorDeduper:
             return 0.0
         return inter / union
 
-    def _cosine(self, v1, v2) -> float:
+    def _jaccard_matrix(self, token_sets: List[Set[str]]) -> np.ndarray:
+        """
+        Pairwise token Jaccard similarity for all phrases at once.
+
+        Builds a (P x V) token-presence matrix so intersections come from a
+        single matrix product; empty token sets score 0 against everything.
+        """
+        vocab: dict = {}
+        rows: List[int] = []
+        cols: List[int] = []
+        for i, tokens in enumerate(token_sets):
+            for token in tokens:
+                rows.append(i)
+                cols.append(vocab.setdefault(token, len(vocab)))
+
+        presence = np.zeros((len(token_sets), len(vocab)), dtype=np.int32)
+        presence[rows, cols] = 1
+
+        inter = presence @ presence.T
+        counts = presence.sum(axis=1)
+        union = counts[:, None] + counts[None, :] - inter
+        return inter / np.maximum(union, 1)
+
+    def _matches_any(self, cand: Set[str], kept: List[Set[str]]) -> bool:
+        """Whether ``cand`` reaches the Jaccard threshold against any kept set."""
+        for prev in kept:
+            if not cand or not prev:
+                j = 0.0
+            else:
+                j = len(cand & prev) / len(cand | prev)
+            if j >= self.token_jaccard_thresh:
+                return True
+        return False
+
+    def _unit_embeddings(self, phrases: List[str]) -> Optional[np.ndarray]:
         """
-        Cosine similarity between two 1-D numpy arrays.
-        Only used if embedder is provided.
+        Encode all phrases in one embedder call and L2-normalize the rows,
+        so cosine similarity reduces to a dot product. Zero vectors stay zero
+        and therefore score 0 against everything.
+        Returns None if the embedder fails.
         """
+        try:
+            embeds = np.asarray(self.embedder.encode(phrases), dtype=np.float64)
+        except Exception:
+            return None
 
-        denom = (np.linalg.norm(v1) * np.linalg.norm(v2))
-        if denom == 0:
-            return 0.0
-        return float(np.dot(v1, v2) / denom)
+        norms = np.linalg.norm(embeds, axis=1, keepdims=True)
+        return np.divide(embeds, norms, out=np.zeros_like(embeds), where=norms > 0)
 
     def dedup(self, phrases: List[str]) -> List[str]:
         """
@@ -84,61 +124,45 @@ class DescriptorDeduper:
         if not phrases:
             return []
 
+        token_sets = [set(self._canonical_tokens(phrase)) for phrase in phrases]
+        jaccard = (
+            self._jaccard_matrix(token_sets)
+            if len(phrases) >= self.MATRIX_MIN_PHRASES
+            else None
+        )
+
         kept_phrases: List[str] = []
+        kept_indices: List[int] = []
         kept_token_sets: List[set] = []
-        kept_embeds: Optional[List[Any]] = None
-        embeds = None
 
         # Pre-compute embeddings if embedder is provided
+        unit_embeds = None
         if self.embedder is not None:
-            try:
-                embeds = self.embedder.encode(phrases)  # shape (N, D)
-                kept_embeds = []
-            except Exception:
+            unit_embeds = self._unit_embeddings(phrases)
+            if unit_embeds is None:
                 # If embedding fails, fall back to token-only dedup
                 self.embedder = None
-                embeds = None
 
         for idx, phrase in enumerate(phrases):
-            cand_tokens_list = self._canonical_tokens(phrase)
-            cand_tokens_set = set(cand_tokens_list)
-
-            is_duplicate = False
+            cand_tokens_set = token_sets[idx]
 
             # Token-level comparison
-            for prev_tokens_set in kept_token_sets:
-                if not cand_tokens_set or not prev_tokens_set:
-                    j = 0.0
-                else:
-                    inter = len(cand_tokens_set & prev_tokens_set)
-                    union = len(cand_tokens_set | prev_tokens_set)
-                    if union == 0:
-                        j = 0.0
-                    else:
-                        j = inter / union
-
-                if j >= self.token_jaccard_thresh:
-                    is_duplicate = True
-                    break
+            if jaccard is not None:
+                is_duplicate = bool(
+                    kept_indices
+                    and (jaccard[idx, kept_indices] >= self.token_jaccard_thresh).any()
+                )
+            else:
+                is_duplicate = self._matches_any(cand_tokens_set, kept_token_sets)
 
             # Optional: semantic (embedding-based) comparison
-            if not is_duplicate and self.embedder is not None and kept_embeds is not None:
-                if embeds is not None:
-                    cand_vec = embeds[idx]
-                else:
-                    cand_vec = self.embedder.encode([phrase])[0]  # Fallback if batch failed
-
-                for prev_vec in kept_embeds:
-                    sim = self._cosine(cand_vec, prev_vec)
-                    if sim >= self.semantic_thresh:
-                        is_duplicate = True
-                        break
-                if not is_duplicate:
-                    kept_embeds.append(cand_vec)
+            if not is_duplicate and unit_embeds is not None and kept_indices:
+                sims = unit_embeds[kept_indices] @ unit_embeds[idx]
+                is_duplicate = bool((sims >= self.semantic_thresh).any())
 
             if not is_duplicate:
                 kept_phrases.append(phrase)
+                kept_indices.append(idx)
                 kept_token_sets.append(cand_tokens_set)
-                # kept_embeds is already updated above when embedder is used
 
         return kept_phrases
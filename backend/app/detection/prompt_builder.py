@@ -4,6 +4,13 @@ from typing import List, Optional, Sequence
 
 from app.detection.types import PromptSpec, PromptTier
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_WORD_CHARS_RE = re.compile(r"[^A-Za-z0-9\s\-']")
+_LEADING_DETERMINER_RE = re.compile(
+    r"^(a|an|the|this|that|these|those|some|several|many)\s+", re.IGNORECASE
+)
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[-'][a-z0-9]+)?")
+
 
 @dataclass
 class PromptBuilder:
@@ -194,7 +201,8 @@ class PromptBuilder:
 
     def _truncate_to_word_limit(self, text: str, max_words: int) -> str:
         """Truncate text to approximately max_words, ending at a clean boundary."""
-        words = text.split()
+        # Split off at most max_words words; anything past them stays in one tail
+        words = text.split(maxsplit=max_words)
         if len(words) <= max_words:
             return text
         # Find a clean cut point (at comma or period)
@@ -208,20 +216,15 @@ class PromptBuilder:
 
     @staticmethod
     def _normalize_spaces(text: str) -> str:
-        return re.sub(r"\s+", " ", text).strip()
+        return _WHITESPACE_RE.sub(" ", text).strip()
 
     def _extract_subject_phrase(self, text: str) -> str:
-        cleaned = re.sub(r"[^A-Za-z0-9\s\-']", " ", text or "")
+        cleaned = _NON_WORD_CHARS_RE.sub(" ", text or "")
         cleaned = self._normalize_spaces(cleaned)
         if not cleaned:
             return "object"
 
-        cleaned = re.sub(
-            r"^(a|an|the|this|that|these|those|some|several|many)\s+",
-            "",
-            cleaned,
-            flags=re.IGNORECASE,
-        )
+        cleaned = _LEADING_DETERMINER_RE.sub("", cleaned)
         words = cleaned.split()
         if not words:
             return "object"
@@ -239,7 +242,7 @@ class PromptBuilder:
 
     @staticmethod
     def _tokenize(text: str) -> List[str]:
-        return re.findall(r"[a-z0-9]+(?:[-'][a-z0-9]+)?", (text or "").lower())
+        return _TOKEN_RE.findall((text or "").lower())
 
     def _content_tokens(self, text: str) -> List[str]:
         return [t for t in self._tokenize(text) if t not in self.stopwords]
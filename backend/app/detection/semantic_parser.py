@@ -1,10 +1,19 @@
+import functools
+
 import spacy
 
 from app.detection.backend import PromptBackend
 
+
+@functools.lru_cache(maxsize=None)
+def _load_pipeline(model_name: str):
+    # Loading a pipeline reads the model from disk; every parser shares one copy
+    return spacy.load(model_name)
+
+
 class SemanticParser(PromptBackend):
     def __init__(self, model_name = "en_core_web_sm"):
-        self.nlp = spacy.load(model_name)
+        self.nlp = _load_pipeline(model_name)
     
     def parse(self, text: str):
         return self.nlp(text)
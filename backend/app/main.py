@@ -86,6 +86,7 @@ async def lifespan(app: FastAPI):
 
     await cleanup_dependencies()
     logger.info("Shutdown complete")
+    await logger.complete()
 
 
 async def _periodic_cleanup() -> None:
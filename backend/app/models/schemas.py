@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from pydantic import BaseModel, Field, field_validator
@@ -127,7 +127,8 @@ class ErrorResponse(BaseModel):
     detail: str = Field(..., description="Detailed error message")
     request_id: str = Field(..., description="Request identifier for tracking")
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Error timestamp"
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="Error timestamp (UTC)",
     )
     details: Optional[Dict[str, Any]] = Field(
         None, description="Additional error details and context"
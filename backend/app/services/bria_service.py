@@ -20,6 +20,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import httpx
+import orjson
 from loguru import logger
 from PIL import Image
 from pydantic import BaseModel, Field, ConfigDict
@@ -227,6 +228,11 @@ class BriaService:
     CACHE_MAX_AGE = 24 * 60 * 60  # 24 hours
     MIN_REQUEST_INTERVAL = 1.0  # 1 second between requests
     VISUAL_CACHE_MAX_ENTRIES = 128
+    SPATIAL_EDIT_RE = re.compile(
+        r"\b(move|moved|relocate|reposition|shift|position|top|bottom|left|right|center|middle|"
+        r"size|resize|resized|smaller|larger|bigger|tiny|huge|isolated|separate|apart)\b",
+        re.IGNORECASE,
+    )
 
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or settings.bria_api_key
@@ -378,31 +384,19 @@ class BriaService:
         # Fallback: assume it's a public URL
         return trimmed
 
-    @staticmethod
+    @classmethod
     def _should_skip_mask_for_instruction(
+        cls,
         modification_prompt: Optional[str],
         structured_instruction_payload: Dict[str, Any],
     ) -> bool:
         """
         Skip mask for spatial edits where destination likely falls outside source mask.
         """
-        prompt_parts: List[str] = []
-        if isinstance(modification_prompt, str) and modification_prompt.strip():
-            prompt_parts.append(modification_prompt.strip().lower())
         edit_instruction = structured_instruction_payload.get("edit_instruction")
-        if isinstance(edit_instruction, str) and edit_instruction.strip():
-            prompt_parts.append(edit_instruction.strip().lower())
-
-        if not prompt_parts:
-            return False
-
-        combined = " ".join(prompt_parts)
-        return bool(
-            re.search(
-                r"\b(move|moved|relocate|reposition|shift|position|top|bottom|left|right|center|middle|"
-                r"size|resize|resized|smaller|larger|bigger|tiny|huge|isolated|separate|apart)\b",
-                combined,
-            )
+        return any(
+            isinstance(text, str) and cls.SPATIAL_EDIT_RE.search(text)
+            for text in (modification_prompt, edit_instruction)
         )
 
     @staticmethod
@@ -768,7 +762,7 @@ class BriaService:
         if sp_data is None:
             sp_data = result_data.get("structured_instruction", {})
         if isinstance(sp_data, str):
-            sp_data = json.loads(sp_data)
+            sp_data = orjson.loads(sp_data)
 
         result = GenerationResult(
             image_url=result_data["image_url"],
@@ -828,9 +822,9 @@ class BriaService:
             payload["images"] = images
         if structured_prompt:
             # For refinement, structured_prompt should be a JSON string
-            payload["structured_prompt"] = json.dumps(
+            payload["structured_prompt"] = orjson.dumps(
                 structured_prompt.model_dump(exclude_none=True)
-            )
+            ).decode()
             # Add modification prompt if refining
             if modification_prompt:
                 payload["prompt"] = modification_prompt
@@ -858,7 +852,7 @@ class BriaService:
         if sp_data is None:
             sp_data = result_data.get("structured_instruction", {})
         if isinstance(sp_data, str):
-            sp_data = json.loads(sp_data)
+            sp_data = orjson.loads(sp_data)
 
         return StructuredPrompt(**sp_data)
 
@@ -952,7 +946,9 @@ class BriaService:
         # Re-using an older edit_instruction causes stale refinements.
         if modification_prompt and modification_prompt.strip():
             structured_instruction_payload["edit_instruction"] = modification_prompt.strip()
-        structured_instruction_json = json.dumps(structured_instruction_payload)
+        structured_instruction_json = orjson.dumps(
+            structured_instruction_payload
+        ).decode()
 
         normalized_image = self._normalize_visual_input(source_image, "source_image")
         payload: Dict[str, Any] = {
@@ -1025,7 +1021,7 @@ class BriaService:
         if sp_data is None:
             sp_data = result_data.get("structured_prompt", {})
         if isinstance(sp_data, str):
-            sp_data = json.loads(sp_data)
+            sp_data = orjson.loads(sp_data)
 
         result = GenerationResult(
             image_url=result_data["image_url"],
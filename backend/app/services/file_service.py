@@ -1,8 +1,10 @@
 import asyncio
+import functools
+import shutil
 import time
 import uuid
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import numpy as np
 import torch
@@ -12,10 +14,17 @@ from PIL import Image
 
 from app.config import settings
 
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
 
 class FileService:
     """Manages file storage and retrieval for segmentation results."""
 
+    # zlib effort for mask PNGs. Masks are mostly empty alpha, so the
+    # fastest level still compresses well and encodes markedly quicker
+    # than Pillow's default of 6.
+    MASK_PNG_COMPRESS_LEVEL = 1
+
     def __init__(
         self, uploads_dir: Optional[Path] = None, outputs_dir: Optional[Path] = None
     ) -> None:
@@ -30,8 +39,15 @@ class FileService:
             f"outputs={self.outputs_dir}"
         )
 
-    async def save_upload(self, file: UploadFile, result_id: str) -> Path:
-        """Save uploaded file with unique identifier."""
+    async def save_upload(
+        self, file: UploadFile, result_id: str, digest: Optional[Any] = None
+    ) -> Path:
+        """
+        Save uploaded file with unique identifier.
+
+        ``digest`` is an optional hashlib object that is fed the upload bytes
+        as they are written, so callers get a content hash without re-reading.
+        """
         try:
             result_dir = self.uploads_dir / result_id
             result_dir.mkdir(parents=True, exist_ok=True)
@@ -40,6 +56,8 @@ class FileService:
             file_path = result_dir / f"original{file_extension}"
 
             content = await file.read()
+            if digest is not None:
+                digest.update(content)
 
             loop = asyncio.get_event_loop()
             await loop.run_in_executor(None, file_path.write_bytes, content)
@@ -71,20 +89,30 @@ class FileService:
             elif mask_array.dim() == 3:
                 mask_array = mask_array.squeeze(0)
 
-            mask_np = mask_array.cpu().numpy()
-
-            if mask_np.dtype == bool:
-                mask_np = mask_np.astype(np.uint8) * 255
-            elif mask_np.dtype == np.float32 or mask_np.dtype == np.float64:
-                mask_np = (mask_np * 255).astype(np.uint8)
+            # Scale to uint8 on the tensor's own device: a GPU mask crosses to
+            # the host at one byte per pixel, and half-precision masks (which
+            # numpy cannot represent) are handled the same as float32.
+            mask = mask_array.detach()
+            if mask.dtype == torch.bool:
+                mask = mask.to(torch.uint8).mul_(255)
+            elif mask.is_floating_point():
+                mask = mask.mul(255).clamp_(0, 255).to(torch.uint8)
+            mask_np = mask.cpu().numpy()
 
             # Encode mask into alpha channel so frontends can use it directly as a CSS mask.
             rgba = np.zeros((*mask_np.shape, 4), dtype=np.uint8)
-            rgba[..., 3] = mask_np  # alpha
+            rgba[..., 3] = mask_np
             mask_image = Image.fromarray(rgba, mode="RGBA")
 
             loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, mask_image.save, mask_path)
+            await loop.run_in_executor(
+                None,
+                functools.partial(
+                    mask_image.save,
+                    mask_path,
+                    compress_level=self.MASK_PNG_COMPRESS_LEVEL,
+                ),
+            )
 
             # Generate URL based on the actual output directory
             if output_dir:
@@ -103,6 +131,41 @@ class FileService:
             )
             raise RuntimeError(f"Failed to save mask image: {e}") from e
 
+    async def save_original(
+        self, upload_path: Path, image: Image.Image, result_id: str
+    ) -> Path:
+        """
+        Write the result's original.png next to its masks.
+
+        Uploads that are already 8-bit RGB PNGs are copied byte-for-byte;
+        anything else is re-encoded from the decoded RGB image.
+        """
+        original_path = self.outputs_dir / result_id / "original.png"
+        original_path.parent.mkdir(parents=True, exist_ok=True)
+
+        loop = asyncio.get_event_loop()
+        if await loop.run_in_executor(None, self._is_rgb8_png, upload_path):
+            await loop.run_in_executor(None, shutil.copyfile, upload_path, original_path)
+        else:
+            await loop.run_in_executor(None, image.save, original_path)
+        return original_path
+
+    @staticmethod
+    def _is_rgb8_png(path: Path) -> bool:
+        """Check the PNG signature and IHDR for 8-bit truecolor without alpha."""
+        try:
+            with open(path, "rb") as f:
+                header = f.read(26)
+        except OSError:
+            return False
+        return (
+            len(header) == 26
+            and header[:8] == _PNG_SIGNATURE
+            and header[12:16] == b"IHDR"
+            and header[24] == 8  # bit depth
+            and header[25] == 2  # color type: RGB
+        )
+
     def get_result_path(self, result_id: str, filename: str) -> Path:
         """Get path for result file."""
         return self.outputs_dir / result_id / filename
@@ -149,8 +212,6 @@ class FileService:
     @staticmethod
     def _remove_directory(directory: Path) -> None:
         """Remove directory and all its contents."""
-        import shutil
-
         shutil.rmtree(directory)
 
     @staticmethod
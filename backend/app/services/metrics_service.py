@@ -89,10 +89,29 @@ class MetricsService:
             duration_ms: Processing duration in milliseconds
         """
         with self._data_lock:
-            self._data.processing_times.append(duration_ms)
-            
-            if len(self._data.processing_times) > 1000:
-                self._data.processing_times = self._data.processing_times[-1000:]
+            self._append_processing_time(duration_ms)
+
+    def record_completed(self, duration_ms: float, status_code: int) -> None:
+        """
+        Record a finished request's duration and outcome under one lock.
+
+        Args:
+            duration_ms: Processing duration in milliseconds
+            status_code: HTTP status code; 2xx/3xx count as successes
+        """
+        with self._data_lock:
+            self._append_processing_time(duration_ms)
+            if 200 <= status_code < 400:
+                self._data.success_count += 1
+            else:
+                self._data.error_count += 1
+
+    def _append_processing_time(self, duration_ms: float) -> None:
+        """Append a duration, keeping the last 1000. Caller holds the lock."""
+        self._data.processing_times.append(duration_ms)
+
+        if len(self._data.processing_times) > 1000:
+            self._data.processing_times = self._data.processing_times[-1000:]
     
     def get_metrics(self) -> Dict[str, any]:
         """
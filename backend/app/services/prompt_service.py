@@ -1,12 +1,18 @@
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Sequence
+from typing import Any, Dict, List, Sequence, Tuple
+
+import orjson
 
 from app.detection.field_spec_builder import FieldSpecBuilder
 from app.detection.prompt_builder import PromptBuilder
 from app.detection.semantic_refiner import SemanticRefiner
 from app.detection.types import PromptPlan, PromptSpec, PromptTier
 
+# Object label plus its (tier, text) prompt candidates, in plan order
+_RenderedPlans = Tuple[str, Tuple[Tuple[PromptTier, str], ...]]
+
 
 @dataclass
 class PromptPlanSet:
@@ -27,8 +33,14 @@ class PromptPipeline:
       - Parse raw JSON into PromptSpec (FieldSpecBuilder)
       - Refine with NLP/dedup (SemanticRefiner)
       - Render prompt strings per PromptTier (PromptBuilder)
+
+    Rendered plans are memoized per distinct metadata object, so clients
+    re-sending the same metadata skip the NLP refinement entirely.
     """
 
+    # Distinct metadata objects whose rendered plans are kept in memory
+    PLAN_CACHE_SIZE = 1024
+
     def __init__(
         self,
         field_parser: FieldSpecBuilder | None = None,
@@ -45,6 +57,7 @@ class PromptPipeline:
             PromptTier.CORE,
             PromptTier.CORE_VISUAL,
         )
+        self._plan_cache: "OrderedDict[Tuple[str, bytes], _RenderedPlans]" = OrderedDict()
 
     @staticmethod
     def _is_placeholder_label(label: str) -> bool:
@@ -74,6 +87,28 @@ class PromptPipeline:
 
         for idx, obj in enumerate(objects):
             spec_label = self._derive_label(obj, idx)
+            try:
+                cache_key = (
+                    spec_label,
+                    orjson.dumps(obj, option=orjson.OPT_SORT_KEYS),
+                )
+            except TypeError:
+                cache_key = None
+
+            cached = self._plan_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                self._plan_cache.move_to_end(cache_key)
+                label, rendered = cached
+                prompt_sets.append(
+                    PromptPlanSet(
+                        label=label,
+                        plans=[
+                            PromptPlan(label=label, tier=tier, text=text)
+                            for tier, text in rendered
+                        ],
+                    )
+                )
+                continue
 
             spec: PromptSpec = self.field_parser.parse(obj, spec_label)
             spec = self.refiner.refine(obj, spec)
@@ -110,6 +145,13 @@ class PromptPipeline:
                 )
 
             prompt_sets.append(PromptPlanSet(label=spec.label, plans=plans))
+            if cache_key:
+                self._plan_cache[cache_key] = (
+                    spec.label,
+                    tuple((plan.tier, plan.text) for plan in plans),
+                )
+                if len(self._plan_cache) > self.PLAN_CACHE_SIZE:
+                    self._plan_cache.popitem(last=False)
 
         return prompt_sets
 
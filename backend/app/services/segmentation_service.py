@@ -1,10 +1,15 @@
 import asyncio
-import json
+import functools
+import hashlib
 import math
 import re
+import threading
 import time
-from typing import Any, Callable, Dict, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
+import orjson
 import torch
 from fastapi import UploadFile
 from loguru import logger
@@ -22,6 +27,171 @@ from app.services.file_service import FileService
 from app.services.prompt_service import PromptPipeline, PromptPlanSet
 
 
+# Vocabulary for _extract_prompt_object, built once at import time.
+_CONCRETE_NOUNS = frozenset({
+    # People
+    "person", "man", "woman", "child", "boy", "girl", "baby", "people", "crowd",
+    "soldier", "doctor", "teacher", "chef", "artist", "musician", "dancer",
+    "lady", "gentleman", "teenager", "adult", "elder", "figure", "character",
+    # Fantasy/Characters
+    "demon", "angel", "dragon", "wizard", "knight", "warrior", "monster", "creature",
+    "giant", "dwarf", "elf", "fairy", "ghost", "vampire", "zombie", "robot", "alien",
+    "witch", "sorcerer", "mage", "hero", "villain", "god", "goddess", "spirit",
+    # Animals
+    "dog", "cat", "bird", "horse", "cow", "sheep", "fish", "lion", "tiger", "bear",
+    "elephant", "rabbit", "mouse", "deer", "wolf", "fox", "monkey", "gorilla", "penguin",
+    "duck", "chicken", "eagle", "owl", "snake", "frog", "turtle", "dolphin", "whale",
+    "butterfly", "bee", "spider", "ant", "dragon", "phoenix",
+    # Body parts
+    "face", "head", "hand", "hands", "arm", "arms", "leg", "legs", "eye", "eyes",
+    "wings", "wing", "tail", "horn", "horns", "hair", "finger", "fingers",
+    # Plants/Nature
+    "flower", "flowers", "rose", "petal", "petals", "leaf", "leaves", "tree", "trees",
+    "plant", "plants", "grass", "bush", "vine", "blossom", "bloom", "bud",
+    "rock", "stone", "mountain", "river", "lake", "ocean", "beach", "forest",
+    "cloud", "clouds", "sun", "moon", "star", "stars", "sky",
+    # Vehicles
+    "car", "bus", "truck", "van", "motorcycle", "bike", "bicycle", "train", "plane",
+    "boat", "ship", "helicopter", "spacecraft", "rocket", "submarine", "vehicle",
+    # Furniture
+    "chair", "table", "desk", "sofa", "couch", "bed", "lamp", "shelf", "cabinet",
+    "drawer", "bench", "stool", "throne", "seat",
+    # Food/Drink
+    "apple", "orange", "banana", "pizza", "burger", "sandwich", "cake", "bread",
+    "fruit", "vegetable", "meat", "cheese", "wine", "beer", "water", "coffee",
+    # Weapons/Tools
+    "sword", "axe", "knife", "gun", "bow", "arrow", "shield", "spear", "hammer",
+    "staff", "wand", "blade", "dagger", "weapon",
+    # Accessories/Clothing
+    "sunglasses", "glasses", "hat", "helmet", "crown", "ring", "necklace", "bracelet",
+    "watch", "earring", "earrings", "mask", "cape", "cloak", "jewelry",
+    "shirt", "dress", "pants", "shoes", "jacket", "coat", "robe", "armor", "gown",
+    # Objects
+    "ball", "box", "bag", "bottle", "cup", "glass", "plate", "bowl", "book", "phone",
+    "computer", "laptop", "camera", "clock", "key", "door", "window", "mirror",
+    "candle", "torch", "flag", "banner", "sign", "poster", "picture", "frame",
+    "gem", "gemstone", "jewel", "crystal", "orb", "sphere", "cube",
+    # Buildings/Structures
+    "house", "building", "tower", "bridge", "road", "street", "path", "castle",
+    "temple", "church", "palace", "wall", "gate", "arch", "column", "pillar",
+    # Abstract but visible
+    "light", "shadow", "glow", "aura", "flame", "fire", "smoke", "mist", "fog",
+})
+
+# Words that are definitely modifiers (adjectives, adverbs)
+_MODIFIERS = frozenset({
+    # Size
+    "small", "large", "big", "tiny", "huge", "tall", "short", "long", "wide", "narrow",
+    "massive", "miniature", "giant", "little",
+    # Colors
+    "red", "blue", "green", "yellow", "black", "white", "brown", "golden", "silver",
+    "orange", "pink", "purple", "crimson", "scarlet", "dark", "light", "bright",
+    "colorful", "pale", "vivid", "vibrant", "muted", "pastel",
+    # Age/Time
+    "old", "new", "young", "ancient", "modern", "vintage", "classic", "contemporary",
+    "fresh", "aged", "eternal",
+    # Material
+    "wooden", "metal", "plastic", "glass", "stone", "leather", "fabric", "silk",
+    "cotton", "velvet", "satin", "lace",
+    # Appearance
+    "beautiful", "ugly", "pretty", "handsome", "cute", "elegant", "fancy", "majestic",
+    "delicate", "rough", "smooth", "sleek", "shiny", "glossy", "matte", "dull",
+    "soft", "hard", "fuzzy", "fluffy", "sharp", "angular", "round", "curved",
+    # Emotion/State
+    "happy", "sad", "angry", "calm", "peaceful", "cheerful", "fierce", "menacing",
+    "serene", "gentle", "wild", "tame",
+    # Physical attributes
+    "male", "female", "muscular", "imposing", "powerful", "formidable", "slender",
+    "thin", "thick", "fat", "lean", "athletic",
+    # Other adjectives
+    "public", "private", "commercial", "reflective", "leathery", "scaly",
+    "fallen", "floating", "flying", "standing", "sitting", "lying", "running",
+    "organic", "irregular", "natural", "artificial", "magical", "mystical",
+    "asian", "european", "african", "american", "eastern", "western",
+    # Adverbs/others to skip
+    "predominantly", "slightly", "somewhat", "very", "quite", "rather",
+    "freshly", "newly", "recently", "slowly", "quickly", "gently",
+})
+
+_LEADING_ARTICLES = (
+    "a ", "an ", "the ", "this ", "that ", "some ", "any ",
+    "pair of ", "set of ", "group of ", "bunch of ",
+)
+
+# Prepositions/subordinate clause markers that end the main subject phrase.
+# Order matters - more specific patterns come first.
+_PREP_SEPARATORS = (
+    ", her ", ", his ", ", its ", ", their ",  # Possessive subordinate clauses
+    " with ", " on ", " in ", " at ", " by ", " near ",
+    " wearing ", " holding ", " carrying ", " featuring ",
+)
+
+_TOKEN_STRIP_CHARS = ".,!?;:'\"()[]"
+_ADJECTIVE_SUFFIXES = ("ly", "ful", "less", "ous", "ive", "ing", "ed")
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_prompt_object_cached(text: str) -> Optional[str]:
+    """Extract the head noun from already stripped, lowercased prompt text."""
+    # FIRST: Isolate the main subject phrase (before prepositions/subordinate clauses)
+    # Remove articles first
+    clean_text = text
+    for article in _LEADING_ARTICLES:
+        if clean_text.startswith(article):
+            clean_text = clean_text[len(article):]
+            break
+
+    # Split by prepositions/subordinate clause markers to get main subject
+    # The first separator in list order wins, even if another occurs earlier.
+    main_phrase = clean_text
+    for sep in _PREP_SEPARATORS:
+        cut = clean_text.find(sep)
+        if cut != -1:
+            main_phrase = clean_text[:cut]
+            break
+
+    # Get words from main phrase (replace commas with spaces)
+    words = main_phrase.replace(",", " ").split()
+    if not words:
+        # Fallback to full text if main_phrase extraction failed
+        words = text.replace(",", " ").replace(".", " ").split()
+
+    if not words:
+        return None
+
+    # Strip punctuation once per token; every pass below reuses these.
+    clean_words = [word.strip(_TOKEN_STRIP_CHARS) for word in words]
+
+    # SECOND: Look for concrete nouns in the MAIN PHRASE only.
+    # Prefer the last match (head noun in English NP).
+    phrase_nouns = [word for word in clean_words if word in _CONCRETE_NOUNS]
+    if phrase_nouns:
+        return phrase_nouns[-1]
+
+    # THIRD: If no concrete noun found in main phrase, scan full text
+    all_words = text.replace(",", " ").replace(".", " ").split()
+    for word in all_words:
+        clean_word = word.strip(_TOKEN_STRIP_CHARS)
+        if clean_word in _CONCRETE_NOUNS:
+            # Return first concrete noun found in full text
+            return clean_word
+
+    # FOURTH: Find last non-modifier word in main phrase (likely the head noun)
+    for clean_word in reversed(clean_words):
+        if clean_word and clean_word not in _MODIFIERS and len(clean_word) > 2:
+            # Skip words that look like adjectives (ending in common suffixes)
+            if not clean_word.endswith(_ADJECTIVE_SUFFIXES):
+                return clean_word
+
+    # FIFTH: Last resort - return last word of main phrase
+    if clean_words:
+        last = clean_words[-1]
+        if last and len(last) > 2:
+            return last
+
+    return None
+
+
 class SegmentationService:
     """Orchestrates segmentation workflow."""
 
@@ -34,6 +204,29 @@ class SegmentationService:
         self.sam3_model = sam3_model
         self.file_service = file_service
         self.prompt_pipeline = prompt_pipeline or PromptPipeline()
+        # Fallback when neither prompts nor metadata yield any plans; the
+        # plan sets are only read during detection, so one copy is shared.
+        self._default_prompt_sets = self.prompt_pipeline.build_from_prompts(["object"])
+        # Model calls get their own single worker so long detections never
+        # queue ahead of the image decode/encode work on the I/O pool.
+        self._inference_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sam3-inference"
+        )
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="segmentation-io"
+        )
+        # Decoded RGB uploads (with their pixel bytes) keyed by content
+        # digest, so retried or re-submitted images skip the PNG/JPEG decode.
+        self._decoded_images: "OrderedDict[bytes, Tuple[Image.Image, int]]" = (
+            OrderedDict()
+        )
+        self._decoded_images_bytes = 0
+        self._decoded_images_lock = threading.Lock()
+
+    def shutdown(self) -> None:
+        """Stop the inference and I/O worker threads."""
+        self._inference_executor.shutdown(wait=True, cancel_futures=True)
+        self._io_executor.shutdown(wait=True, cancel_futures=True)
 
     async def process_segmentation(
         self,
@@ -76,29 +269,41 @@ class SegmentationService:
             if progress_callback:
                 progress_callback(10, "Saving uploaded image...")
             
-            # If custom output_dir, save image there; otherwise use default
+            loop = asyncio.get_event_loop()
+
+            # If custom output_dir, save image there; otherwise use default.
+            # Both writers hash the bytes as they pass through.
             if output_dir:
                 image_path = output_dir / "original.png"
-                content = await image_file.read()
+                upload_digest = await loop.run_in_executor(
+                    self._io_executor, self._copy_upload, image_file.file, image_path
+                )
                 await image_file.seek(0)
-                image_path.write_bytes(content)
             else:
-                image_path = await self.file_service.save_upload(image_file, result_id)
+                digest = self._new_upload_digest()
+                image_path = await self.file_service.save_upload(
+                    image_file, result_id, digest=digest
+                )
+                upload_digest = digest.digest()
 
-            loop = asyncio.get_event_loop()
-            image = await loop.run_in_executor(
-                None, lambda: Image.open(image_path).convert("RGB")
+            # Decode the image off-thread while the metadata upload is parsed
+            image_future = loop.run_in_executor(
+                self._io_executor, self._decode_image, image_path, upload_digest
             )
+            parsed_metadata = None
+            if metadata_file:
+                image, parsed_metadata = await asyncio.gather(
+                    image_future, self._parse_metadata(metadata_file)
+                )
+            else:
+                image = await image_future
+            img_width, img_height = self._get_image_dims(image)
 
             if progress_callback:
                 progress_callback(20, "Extracting prompts...")
-            parsed_metadata = None
-            if metadata_file:
-                parsed_metadata = await self._parse_metadata(metadata_file)
-            
             prompt_sets = await self._build_prompt_sets(parsed_metadata, prompts)
             if not prompt_sets:
-                prompt_sets = self.prompt_pipeline.build_from_prompts(["object"])
+                prompt_sets = self._default_prompt_sets
 
             logger.info(
                 f"Processing segmentation for result_id={result_id} "
@@ -109,9 +314,12 @@ class SegmentationService:
             if progress_callback:
                 progress_callback(30, "Running SAM3 detection...")
             detection_result, prompt_info = await loop.run_in_executor(
-                None, self._run_tiered_detection, image, prompt_sets
+                self._inference_executor,
+                self._run_tiered_detection,
+                image,
+                prompt_sets,
+                (img_width, img_height),
             )
-            img_width, img_height = self._get_image_dims(image)
             if detection_result.masks.numel() > 0 and detection_result.masks.dim() >= 4:
                 # Prefer mask-derived dims to avoid Mock width/height in tests.
                 img_height = detection_result.masks.shape[-2]
@@ -128,9 +336,7 @@ class SegmentationService:
             
             # Save original image (skip if using custom output_dir with existing image)
             if not output_dir:
-                original_image_path = self.file_service.outputs_dir / result_id / "original.png"
-                original_image_path.parent.mkdir(parents=True, exist_ok=True)
-                await loop.run_in_executor(None, image.save, original_image_path)
+                await self.file_service.save_original(image_path, image, result_id)
 
             masks_metadata = self._calculate_mask_metadata(
                 detection_result, mask_urls, img_width, img_height, prompt_info, parsed_metadata
@@ -175,6 +381,62 @@ class SegmentationService:
             logger.exception(f"Segmentation failed for result_id={result_id}: {e}")
             raise RuntimeError(f"Segmentation processing failed: {e}") from e
 
+    UPLOAD_COPY_CHUNK_SIZE = 1 << 20
+
+    @staticmethod
+    def _new_upload_digest() -> "hashlib.blake2b":
+        """Create the hasher that keys the decoded-image cache."""
+        return hashlib.blake2b(digest_size=16)
+
+    @classmethod
+    def _copy_upload(cls, source: BinaryIO, destination: Path) -> bytes:
+        """
+        Stream an upload's file object to disk without buffering it whole.
+
+        Returns the digest of the copied bytes, computed in the same pass.
+        """
+        digest = cls._new_upload_digest()
+        with open(destination, "wb") as out:
+            for chunk in iter(lambda: source.read(cls.UPLOAD_COPY_CHUNK_SIZE), b""):
+                digest.update(chunk)
+                out.write(chunk)
+        return digest.digest()
+
+    # Upper bound on decoded RGB pixel data kept across requests; an image
+    # larger than this on its own is decoded but never cached.
+    DECODED_IMAGE_CACHE_BYTES = 128 * 1024 * 1024
+
+    def _decode_image(self, image_path: Path, upload_digest: bytes) -> Image.Image:
+        """
+        Decode an upload to RGB, reusing a previous decode of the same bytes.
+
+        Every caller gets its own copy, so one request cannot alter the
+        pixels another request reads.
+        """
+        with self._decoded_images_lock:
+            cached = self._decoded_images.get(upload_digest)
+            if cached is not None:
+                self._decoded_images.move_to_end(upload_digest)
+        if cached is not None:
+            return cached[0].copy()
+
+        image = Image.open(image_path).convert("RGB")
+        width, height = self._get_image_dims(image)
+        nbytes = width * height * 3
+        if nbytes > self.DECODED_IMAGE_CACHE_BYTES:
+            return image
+
+        with self._decoded_images_lock:
+            previous = self._decoded_images.pop(upload_digest, None)
+            if previous is not None:
+                self._decoded_images_bytes -= previous[1]
+            self._decoded_images[upload_digest] = (image, nbytes)
+            self._decoded_images_bytes += nbytes
+            while self._decoded_images_bytes > self.DECODED_IMAGE_CACHE_BYTES:
+                _, (_, evicted_bytes) = self._decoded_images.popitem(last=False)
+                self._decoded_images_bytes -= evicted_bytes
+        return image.copy()
+
     async def _build_prompt_sets(
         self, parsed_metadata: Optional[Dict[str, Any]], prompts: Optional[List[str]]
     ) -> List[PromptPlanSet]:
@@ -195,19 +457,12 @@ class SegmentationService:
         """Parse JSON metadata file."""
         try:
             content = await metadata_file.read()
-            if content is None:
+            if not content:
                 raise ValueError("Invalid JSON metadata: empty content")
 
-            if isinstance(content, (bytes, bytearray)):
-                if not content.strip():
-                    raise ValueError("Invalid JSON metadata: empty content")
-            elif isinstance(content, str):
-                if not content.strip():
-                    raise ValueError("Invalid JSON metadata: empty content")
-
-            metadata = json.loads(content)
+            metadata = orjson.loads(content)
             return metadata
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse metadata JSON: {e}")
             raise ValueError(f"Invalid JSON metadata: {e}") from e
         except ValueError as e:
@@ -217,22 +472,29 @@ class SegmentationService:
             logger.exception(f"Failed to read metadata file: {e}")
             raise RuntimeError(f"Failed to read metadata: {e}") from e
 
+    # Maximum number of mask PNG encodes in flight at once
+    MASK_SAVE_CONCURRENCY = 8
+
     async def _generate_mask_images(
         self, detection_result: DetectionResult, original_image: Image.Image, result_id: str,
         output_dir: Optional[Path] = None
     ) -> List[str]:
         """Convert mask tensors to PNG files and return URLs."""
-        mask_urls = []
-
         try:
             num_masks = detection_result.masks.shape[0]
+            semaphore = asyncio.Semaphore(self.MASK_SAVE_CONCURRENCY)
+
+            async def save_one(index: int) -> str:
+                async with semaphore:
+                    return await self.file_service.save_mask(
+                        detection_result.masks[index],
+                        result_id,
+                        index,
+                        output_dir=output_dir,
+                    )
 
-            for i in range(num_masks):
-                mask_tensor = detection_result.masks[i]
-                mask_url = await self.file_service.save_mask(
-                    mask_tensor, result_id, i, output_dir=output_dir
-                )
-                mask_urls.append(mask_url)
+            # gather preserves index order, so mask_urls[i] still matches mask i
+            mask_urls = list(await asyncio.gather(*(save_one(i) for i in range(num_masks))))
 
             logger.debug(f"Generated {len(mask_urls)} mask images for result_id={result_id}")
             return mask_urls
@@ -262,30 +524,44 @@ class SegmentationService:
                 if isinstance(objects_list, list):
                     objects_metadata = objects_list
 
+            # Lowercase each description once instead of once per mask
+            description_index = [
+                (obj, obj.get("description", "").lower())
+                for obj in objects_metadata
+                if isinstance(obj, dict)
+            ]
+
+            areas: List[float] = []
+            area_percentages: List[float] = []
+            centroids_x: List[float] = []
+            centroids_y: List[float] = []
+            if mask_urls:
+                areas_t, cx_t, cy_t = self._mask_areas_and_centroids(detection_result.masks)
+                # Empty masks fall back to the centre of their bounding box
+                box_t = detection_result.boxes_xyxy.to(cx_t.device, torch.float64)
+                has_pixels = areas_t > 0
+                cx_t = torch.where(has_pixels, cx_t, (box_t[:, 0] + box_t[:, 2]) / 2)
+                cy_t = torch.where(has_pixels, cy_t, (box_t[:, 1] + box_t[:, 3]) / 2)
+                areas_f = areas_t.to(torch.float64)
+                # One device-to-host transfer for all per-mask statistics
+                areas, area_percentages, centroids_x, centroids_y = torch.stack(
+                    [areas_f, areas_f / total_pixels * 100, cx_t, cy_t]
+                ).cpu().tolist()
+            scores = detection_result.scores.tolist()
+
+            # Clamp coordinates to non-negative to satisfy schema validation
+            clamped_boxes = self._clamp_boxes(
+                detection_result.boxes_xyxy, image_width, image_height
+            ).tolist()
+
             for i in range(len(mask_urls)):
-                box = detection_result.boxes_xyxy[i]
-                score = detection_result.scores[i]
                 label = detection_result.labels[i]
-                mask = detection_result.masks[i]
-
-                if mask.dim() == 4:
-                    mask = mask.squeeze(0).squeeze(0)
-                elif mask.dim() == 3:
-                    mask = mask.squeeze(0)
-
-                mask_np = mask.cpu().numpy()
-                area_pixels = int(mask_np.sum())
 
-                y_coords, x_coords = mask_np.nonzero()
-                if len(y_coords) > 0 and len(x_coords) > 0:
-                    centroid_x = int(x_coords.mean())
-                    centroid_y = int(y_coords.mean())
-                else:
-                    centroid_x = int((box[0].item() + box[2].item()) / 2)
-                    centroid_y = int((box[1].item() + box[3].item()) / 2)
+                area_pixels = int(areas[i])
+                centroid_x = int(centroids_x[i])
+                centroid_y = int(centroids_y[i])
+                area_percentage = area_percentages[i]
 
-                area_percentage = (area_pixels / total_pixels) * 100
-                
                 prompt_tier = None
                 prompt_text = None
                 prompt_object = None
@@ -300,25 +576,25 @@ class SegmentationService:
                 
                 # Match object metadata first (needed for prompt_object extraction)
                 object_metadata = self._match_object_metadata(
-                    label, prompt_text, objects_metadata, i
+                    label, prompt_text, objects_metadata, description_index, i
                 )
                 
                 # Extract short object name, using object_metadata if available
                 raw_obj_metadata = objects_metadata[i] if i < len(objects_metadata) else None
                 prompt_object = self._extract_prompt_object(prompt_text, raw_obj_metadata)
 
-                # Clamp coordinates to non-negative to satisfy schema validation
-                bbox = self._clamp_box(box, image_width, image_height)
+                x1, y1, x2, y2 = clamped_boxes[i]
+                bbox = BoundingBox(x1=x1, y1=y1, x2=x2, y2=y2)
 
                 try:
                     mask_metadata = MaskMetadata(
                         mask_id=f"mask_{i}",
                         object_id=object_id,
                         label=label,
-                        confidence=float(score.item()),
+                        confidence=scores[i],
                         bounding_box=bbox,
                         area_pixels=area_pixels,
-                        area_percentage=float(area_percentage),
+                        area_percentage=area_percentage,
                         centroid=(centroid_x, centroid_y),
                         mask_url=mask_urls[i],
                         prompt_tier=prompt_tier,
@@ -342,11 +618,38 @@ class SegmentationService:
             logger.exception(f"Failed to calculate mask metadata: {e}")
             raise RuntimeError(f"Failed to calculate mask metadata: {e}") from e
     
+    @staticmethod
+    def _mask_areas_and_centroids(
+        masks: torch.Tensor,
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """
+        Compute pixel areas and centroids for every mask in one batched pass.
+
+        Works on the device the masks already live on by reducing each mask to
+        per-row and per-column pixel counts, so only small (N,) tensors need to
+        be transferred to the host afterwards.
+        """
+        num_masks = masks.shape[0]
+        flat = masks.reshape(num_masks, masks.shape[-2], masks.shape[-1]).bool()
+
+        row_counts = flat.sum(dim=2)  # (N, H)
+        col_counts = flat.sum(dim=1)  # (N, W)
+        areas = row_counts.sum(dim=1)
+
+        ys = torch.arange(flat.shape[1], device=flat.device)
+        xs = torch.arange(flat.shape[2], device=flat.device)
+        denom = areas.clamp_min(1).to(torch.float64)
+        centroid_y = (row_counts * ys).sum(dim=1) / denom
+        centroid_x = (col_counts * xs).sum(dim=1) / denom
+
+        return areas, centroid_x, centroid_y
+
     def _match_object_metadata(
         self,
         label: str,
         prompt_text: Optional[str],
         objects_metadata: List[Dict[str, Any]],
+        description_index: List[Tuple[Dict[str, Any], str]],
         fallback_index: int,
     ) -> Optional[ObjectMetadata]:
         """
@@ -356,25 +659,27 @@ class SegmentationService:
         1. Try to match by description similarity with label/prompt
         2. Fall back to index-based matching
         3. Return None if no match found
+
+        ``description_index`` pairs each dict in ``objects_metadata`` with its
+        lowercased description and is built once per request by the caller.
         """
         if not objects_metadata:
             return None
         
         matched_obj = None
+        label_lower = label.lower() if label else ""
+        prompt_words = (
+            [word for word in prompt_text.lower().split() if len(word) > 3]
+            if prompt_text
+            else []
+        )
         
-        for obj in objects_metadata:
-            if not isinstance(obj, dict):
-                continue
-            
-            obj_desc = obj.get("description", "").lower()
-            
-            if label and label.lower() in obj_desc:
+        for obj, obj_desc in description_index:
+            if label_lower and label_lower in obj_desc:
                 matched_obj = obj
                 break
             
-            if prompt_text and any(
-                word in obj_desc for word in prompt_text.lower().split() if len(word) > 3
-            ):
+            if any(word in obj_desc for word in prompt_words):
                 matched_obj = obj
                 break
         
@@ -403,6 +708,8 @@ class SegmentationService:
 
     # Minimum confidence threshold for accepting detections
     MIN_CONFIDENCE_THRESHOLD = 0.4
+    # A plan scoring at least this ends the tier search for its object
+    EARLY_EXIT_CONFIDENCE = 0.85
     PARTICLE_CONFIDENCE_THRESHOLD = 0.22
     PARTICLE_KEYWORDS = {
         "snowflake",
@@ -444,7 +751,10 @@ class SegmentationService:
         return cls.MIN_CONFIDENCE_THRESHOLD
 
     def _run_tiered_detection(
-        self, image: Image.Image, prompt_sets: List[PromptPlanSet]
+        self,
+        image: Image.Image,
+        prompt_sets: List[PromptPlanSet],
+        image_size: Optional[Tuple[int, int]] = None,
     ) -> tuple[DetectionResult, List[Dict[str, Any]]]:
         """
         Attempt detection per object using confidence-based tier selection.
@@ -454,11 +764,16 @@ class SegmentationService:
         - Pick the tier with highest confidence detection above threshold
         - If no tier exceeds threshold, use best available or skip
         
+        ``image_size`` is the caller's already-resolved (width, height); it is
+        looked up from the image when omitted.
+
         Returns detection result and prompt information for each mask.
         """
         per_object_results: List[DetectionResult] = []
         prompt_info: List[Dict[str, Any]] = []
-        fallback_size = self._get_image_dims(image)
+        fallback_size = image_size or self._get_image_dims(image)
+        # Encode once; every plan below only swaps the text prompt
+        image_state = self.sam3_model.encode_image(image)
 
         for obj_idx, prompt_set in enumerate(prompt_sets):
             best_result: Optional[DetectionResult] = None
@@ -470,7 +785,9 @@ class SegmentationService:
 
             # Try all tiers and pick the best one
             for plan in prompt_set.plans:
-                result = self.sam3_model.detect(image, [plan.text])
+                result = self.sam3_model.detect(
+                    image, [plan.text], image_state=image_state
+                )
                 
                 if result.boxes_xyxy.shape[0] == 0:
                     continue
@@ -485,7 +802,7 @@ class SegmentationService:
                     best_plan = plan
                     
                     # Early exit if we found a high-confidence detection
-                    if best_score >= 0.85:
+                    if best_score >= self.EARLY_EXIT_CONFIDENCE:
                         logger.debug(
                             f"Early exit: high confidence {best_score:.2f} "
                             f"for label={plan.label} tier={plan.tier.value}"
@@ -556,19 +873,17 @@ class SegmentationService:
                 ),
             )
 
-        boxes = torch.cat([r.boxes_xyxy for r in results], dim=0)
-        scores = torch.cat([r.scores for r in results], dim=0)
-        labels: List[str] = []
-        masks = torch.cat([r.masks for r in results], dim=0)
-
-        for r in results:
-            labels.extend(r.labels)
+        if len(results) == 1:
+            # Nothing to merge; avoid copying the mask stack
+            return results[0]
 
+        # One torch.cat per field: each allocates its output once and copies
+        # every input into place.
         return DetectionResult(
-            boxes_xyxy=boxes,
-            scores=scores,
-            labels=labels,
-            masks=masks,
+            boxes_xyxy=torch.cat([r.boxes_xyxy for r in results], dim=0),
+            scores=torch.cat([r.scores for r in results], dim=0),
+            labels=[label for r in results for label in r.labels],
+            masks=torch.cat([r.masks for r in results], dim=0),
         )
 
     @classmethod
@@ -690,6 +1005,10 @@ class SegmentationService:
             if not merged_into_existing:
                 kept_indices.append(idx)
 
+        if merged_count == 0:
+            # Every mask survived; skip re-gathering the full mask stack
+            return result, prompt_info
+
         kept_indices_sorted = sorted(kept_indices)
 
         deduped = DetectionResult(
@@ -702,47 +1021,38 @@ class SegmentationService:
             prompt_info[i] if i < len(prompt_info) else {} for i in kept_indices_sorted
         ]
 
-        if merged_count > 0:
-            logger.info(
-                f"Deduplicated overlapping masks: merged={merged_count}, "
-                f"before={num_masks}, after={len(kept_indices_sorted)}"
-            )
+        logger.info(
+            f"Deduplicated overlapping masks: merged={merged_count}, "
+            f"before={num_masks}, after={len(kept_indices_sorted)}"
+        )
 
         return deduped, deduped_prompt_info
 
     @staticmethod
-    def _clamp_box(
-        box: Any, image_width: int, image_height: int
-    ) -> BoundingBox:
-        """Clamp bounding box coordinates to valid, non-negative image bounds."""
-        def _to_number(val: Any) -> float:
-            try:
-                if hasattr(val, "item"):
-                    val = val.item()
-                return float(val)
-            except Exception:
-                return 0.0
-
-        w = float(image_width) if image_width and image_width > 0 else float("inf")
-        h = float(image_height) if image_height and image_height > 0 else float("inf")
-
-        raw_x1 = _to_number(box[0])
-        raw_y1 = _to_number(box[1])
-        raw_x2 = _to_number(box[2])
-        raw_y2 = _to_number(box[3])
-
-        def _sanitize(value: float, minimum: float = 0.0, maximum: float = float("inf")) -> float:
-            if not math.isfinite(value):
-                value = 0.0
-            value = max(minimum, value)
-            return min(value, maximum)
+    def _clamp_boxes(
+        boxes: torch.Tensor, image_width: int, image_height: int
+    ) -> torch.Tensor:
+        """
+        Clamp all bounding boxes to valid, non-negative image bounds at once.
 
-        x1 = _sanitize(raw_x1, 0.0)
-        y1 = _sanitize(raw_y1, 0.0)
-        x2 = _sanitize(raw_x2, x1, w)
-        y2 = _sanitize(raw_y2, y1, h)
+        Non-finite coordinates become 0, x1/y1 are floored at 0 and x2/y2 are
+        kept between their x1/y1 counterpart and the image size.
+        """
+        w = float(image_width) if image_width and image_width > 0 else math.inf
+        h = float(image_height) if image_height and image_height > 0 else math.inf
+
+        raw = torch.nan_to_num(
+            boxes.detach().reshape(-1, 4).to(torch.float64),
+            nan=0.0,
+            posinf=0.0,
+            neginf=0.0,
+        )
+        x1 = raw[:, 0].clamp_min(0.0)
+        y1 = raw[:, 1].clamp_min(0.0)
+        x2 = torch.maximum(raw[:, 2], x1).clamp_max(w)
+        y2 = torch.maximum(raw[:, 3], y1).clamp_max(h)
 
-        return BoundingBox(x1=x1, y1=y1, x2=x2, y2=y2)
+        return torch.stack([x1, y1, x2, y2], dim=-1)
 
     async def _save_segmentation_meta(
         self,
@@ -757,36 +1067,14 @@ class SegmentationService:
         when loading a generation later.
         """
         segmentation_meta = {
-            "masks": [
-                {
-                    "mask_id": m.mask_id,
-                    "object_id": m.object_id,
-                    "label": m.label,
-                    "confidence": m.confidence,
-                    "bounding_box": {
-                        "x1": m.bounding_box.x1,
-                        "y1": m.bounding_box.y1,
-                        "x2": m.bounding_box.x2,
-                        "y2": m.bounding_box.y2,
-                    },
-                    "area_pixels": m.area_pixels,
-                    "area_percentage": m.area_percentage,
-                    "centroid": list(m.centroid),
-                    "mask_url": m.mask_url,
-                    "prompt_tier": m.prompt_tier,
-                    "prompt_text": m.prompt_text,
-                    "prompt_object": m.prompt_object,
-                    "object_metadata": (
-                        m.object_metadata.model_dump() if m.object_metadata else None
-                    ),
-                }
-                for m in masks_metadata
-            ],
+            "masks": [m.model_dump(mode="json") for m in masks_metadata],
             "source_metadata": parsed_metadata,
         }
         
         meta_path = output_dir / "segmentation_meta.json"
-        meta_path.write_text(json.dumps(segmentation_meta, indent=2))
+        payload = orjson.dumps(segmentation_meta, option=orjson.OPT_INDENT_2)
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(self._io_executor, meta_path.write_bytes, payload)
         logger.debug(f"Saved segmentation metadata to {meta_path}")
 
     @staticmethod
@@ -808,6 +1096,9 @@ class SegmentationService:
         - "A male demon, muscular and imposing" -> "demon"
         - "Sleek, modern black sunglasses" -> "sunglasses"
         """
+        if not prompt_text and not object_metadata:
+            return None
+
         # Get text to parse - prefer object_metadata description
         text_to_parse = None
         if object_metadata and isinstance(object_metadata, dict):
@@ -826,160 +1117,8 @@ class SegmentationService:
         text = text_to_parse.strip().lower()
         if not text:
             return None
-        
-        # Comprehensive concrete nouns list
-        concrete_nouns = {
-            # People
-            "person", "man", "woman", "child", "boy", "girl", "baby", "people", "crowd",
-            "soldier", "doctor", "teacher", "chef", "artist", "musician", "dancer",
-            "lady", "gentleman", "teenager", "adult", "elder", "figure", "character",
-            # Fantasy/Characters
-            "demon", "angel", "dragon", "wizard", "knight", "warrior", "monster", "creature",
-            "giant", "dwarf", "elf", "fairy", "ghost", "vampire", "zombie", "robot", "alien",
-            "witch", "sorcerer", "mage", "hero", "villain", "god", "goddess", "spirit",
-            # Animals
-            "dog", "cat", "bird", "horse", "cow", "sheep", "fish", "lion", "tiger", "bear",
-            "elephant", "rabbit", "mouse", "deer", "wolf", "fox", "monkey", "gorilla", "penguin",
-            "duck", "chicken", "eagle", "owl", "snake", "frog", "turtle", "dolphin", "whale",
-            "butterfly", "bee", "spider", "ant", "dragon", "phoenix",
-            # Body parts
-            "face", "head", "hand", "hands", "arm", "arms", "leg", "legs", "eye", "eyes",
-            "wings", "wing", "tail", "horn", "horns", "hair", "finger", "fingers",
-            # Plants/Nature
-            "flower", "flowers", "rose", "petal", "petals", "leaf", "leaves", "tree", "trees",
-            "plant", "plants", "grass", "bush", "vine", "blossom", "bloom", "bud",
-            "rock", "stone", "mountain", "river", "lake", "ocean", "beach", "forest",
-            "cloud", "clouds", "sun", "moon", "star", "stars", "sky",
-            # Vehicles
-            "car", "bus", "truck", "van", "motorcycle", "bike", "bicycle", "train", "plane",
-            "boat", "ship", "helicopter", "spacecraft", "rocket", "submarine", "vehicle",
-            # Furniture
-            "chair", "table", "desk", "sofa", "couch", "bed", "lamp", "shelf", "cabinet",
-            "drawer", "bench", "stool", "throne", "seat",
-            # Food/Drink
-            "apple", "orange", "banana", "pizza", "burger", "sandwich", "cake", "bread",
-            "fruit", "vegetable", "meat", "cheese", "wine", "beer", "water", "coffee",
-            # Weapons/Tools
-            "sword", "axe", "knife", "gun", "bow", "arrow", "shield", "spear", "hammer",
-            "staff", "wand", "blade", "dagger", "weapon",
-            # Accessories/Clothing
-            "sunglasses", "glasses", "hat", "helmet", "crown", "ring", "necklace", "bracelet",
-            "watch", "earring", "earrings", "mask", "cape", "cloak", "jewelry",
-            "shirt", "dress", "pants", "shoes", "jacket", "coat", "robe", "armor", "gown",
-            # Objects
-            "ball", "box", "bag", "bottle", "cup", "glass", "plate", "bowl", "book", "phone",
-            "computer", "laptop", "camera", "clock", "key", "door", "window", "mirror",
-            "candle", "torch", "flag", "banner", "sign", "poster", "picture", "frame",
-            "gem", "gemstone", "jewel", "crystal", "orb", "sphere", "cube",
-            # Buildings/Structures
-            "house", "building", "tower", "bridge", "road", "street", "path", "castle",
-            "temple", "church", "palace", "wall", "gate", "arch", "column", "pillar",
-            # Abstract but visible
-            "light", "shadow", "glow", "aura", "flame", "fire", "smoke", "mist", "fog",
-        }
-
-        # Words that are definitely modifiers (adjectives, adverbs)
-        modifiers = {
-            # Size
-            "small", "large", "big", "tiny", "huge", "tall", "short", "long", "wide", "narrow",
-            "massive", "miniature", "giant", "little",
-            # Colors
-            "red", "blue", "green", "yellow", "black", "white", "brown", "golden", "silver",
-            "orange", "pink", "purple", "crimson", "scarlet", "dark", "light", "bright",
-            "colorful", "pale", "vivid", "vibrant", "muted", "pastel",
-            # Age/Time
-            "old", "new", "young", "ancient", "modern", "vintage", "classic", "contemporary",
-            "fresh", "aged", "eternal",
-            # Material
-            "wooden", "metal", "plastic", "glass", "stone", "leather", "fabric", "silk",
-            "cotton", "velvet", "satin", "lace",
-            # Appearance
-            "beautiful", "ugly", "pretty", "handsome", "cute", "elegant", "fancy", "majestic",
-            "delicate", "rough", "smooth", "sleek", "shiny", "glossy", "matte", "dull",
-            "soft", "hard", "fuzzy", "fluffy", "sharp", "angular", "round", "curved",
-            # Emotion/State
-            "happy", "sad", "angry", "calm", "peaceful", "cheerful", "fierce", "menacing",
-            "serene", "gentle", "wild", "tame",
-            # Physical attributes
-            "male", "female", "muscular", "imposing", "powerful", "formidable", "slender",
-            "thin", "thick", "fat", "lean", "athletic",
-            # Other adjectives
-            "public", "private", "commercial", "reflective", "leathery", "scaly",
-            "fallen", "floating", "flying", "standing", "sitting", "lying", "running",
-            "organic", "irregular", "natural", "artificial", "magical", "mystical",
-            "asian", "european", "african", "american", "eastern", "western",
-            # Adverbs/others to skip
-            "predominantly", "slightly", "somewhat", "very", "quite", "rather",
-            "freshly", "newly", "recently", "slowly", "quickly", "gently",
-        }
 
-        # FIRST: Isolate the main subject phrase (before prepositions/subordinate clauses)
-        # Remove articles first
-        articles = ["a ", "an ", "the ", "this ", "that ", "some ", "any ",
-                    "pair of ", "set of ", "group of ", "bunch of "]
-        clean_text = text
-        for article in articles:
-            if clean_text.startswith(article):
-                clean_text = clean_text[len(article):]
-                break
-        
-        # Split by prepositions/subordinate clause markers to get main subject
-        # Order matters - try more specific patterns first
-        prep_separators = [
-            ", her ", ", his ", ", its ", ", their ",  # Possessive subordinate clauses
-            " with ", " on ", " in ", " at ", " by ", " near ",
-            " wearing ", " holding ", " carrying ", " featuring ",
-        ]
-        main_phrase = clean_text
-        for sep in prep_separators:
-            if sep in clean_text:
-                main_phrase = clean_text.split(sep)[0]
-                break
-        
-        # Get words from main phrase (replace commas with spaces)
-        words = main_phrase.replace(",", " ").split()
-        if not words:
-            # Fallback to full text if main_phrase extraction failed
-            words = text.replace(",", " ").replace(".", " ").split()
-        
-        if not words:
-            return None
-        
-        # SECOND: Look for concrete nouns in the MAIN PHRASE only
-        found_noun = None
-        for word in words:
-            clean_word = word.strip(".,!?;:'\"()[]")
-            if clean_word in concrete_nouns:
-                found_noun = clean_word
-                # Don't break - prefer last noun (head noun in English NP)
-        
-        if found_noun:
-            return found_noun
-        
-        # THIRD: If no concrete noun found in main phrase, scan full text
-        all_words = text.replace(",", " ").replace(".", " ").split()
-        for word in all_words:
-            clean_word = word.strip(".,!?;:'\"()[]")
-            if clean_word in concrete_nouns:
-                # Return first concrete noun found in full text
-                return clean_word
-        
-        # FOURTH: Find last non-modifier word in main phrase (likely the head noun)
-        for word in reversed(words):
-            clean_word = word.strip(".,!?;:'\"()[]")
-            if clean_word and clean_word not in modifiers and len(clean_word) > 2:
-                # Skip words that look like adjectives (ending in common suffixes)
-                if not any(clean_word.endswith(suffix) for suffix in 
-                          ["ly", "ful", "less", "ous", "ive", "ing", "ed"]):
-                    return clean_word
-        
-        # FIFTH: Last resort - return last word of main phrase
-        if words:
-            last = words[-1].strip(".,!?;:'\"()[]")
-            if last and len(last) > 2:
-                return last
-        
-        return None
+        return _extract_prompt_object_cached(text)
 
     @staticmethod
     def _get_image_dims(image: Image.Image) -> tuple[int, int]:
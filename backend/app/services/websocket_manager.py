@@ -1,12 +1,21 @@
 import asyncio
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, Optional
 
+import orjson
 from fastapi import WebSocket
 from fastapi.encoders import jsonable_encoder
 from loguru import logger
 
 from app.models.schemas import WebSocketMessage
+
+
+def _dumps(payload: Dict[str, Any]) -> str:
+    """Serialize an outgoing message payload to a JSON text frame."""
+    return orjson.dumps(
+        payload, default=str, option=orjson.OPT_SERIALIZE_NUMPY
+    ).decode()
 
 
 class WebSocketManager:
@@ -15,6 +24,12 @@ class WebSocketManager:
     def __init__(self) -> None:
         self.active_connections: Dict[str, WebSocket] = {}
         self.connection_tasks: Dict[str, asyncio.Task] = {}
+        # Messages waiting behind an in-flight send, and the outbox each
+        # client currently has a coroutine draining. Drains are tracked by
+        # outbox identity so a reconnect under the same client_id gets its
+        # own drain instead of waiting on the old connection's.
+        self._outboxes: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._draining: Dict[str, Deque[Dict[str, Any]]] = {}
         logger.info("WebSocketManager initialized")
 
     async def connect(self, websocket: WebSocket, client_id: str) -> None:
@@ -65,6 +80,7 @@ class WebSocketManager:
                         f"Error closing WebSocket for client_id={client_id}: {e}"
                     )
                 del self.active_connections[client_id]
+            self._outboxes.pop(client_id, None)
 
             logger.info(
                 f"WebSocket disconnected: client_id={client_id}, "
@@ -77,12 +93,16 @@ class WebSocketManager:
     async def send_progress(self, client_id: str, progress: int, message: str) -> None:
         """Send progress update to client."""
         try:
-            ws_message = WebSocketMessage(
-                type="progress",
-                data={"progress": progress, "message": message},
-                timestamp=datetime.utcnow(),
+            # Fixed-shape payload on the hot path: skip model construction
+            await self._send_payload(
+                client_id,
+                {
+                    "type": "progress",
+                    "data": {"progress": progress, "message": message},
+                    "timestamp": datetime.utcnow(),
+                },
+                coalesce=True,
             )
-            await self._send_message(client_id, ws_message)
             logger.debug(f"Sent progress to client_id={client_id}: {progress}%")
 
         except Exception as e:
@@ -133,17 +153,54 @@ class WebSocketManager:
 
     async def _send_message(self, client_id: str, message: WebSocketMessage) -> None:
         """Internal method to send message to specific client."""
+        await self._send_payload(
+            client_id,
+            {
+                "type": message.type,
+                "data": message.data,
+                "timestamp": message.timestamp,
+            },
+        )
+
+    async def _send_payload(
+        self, client_id: str, payload: Dict[str, Any], coalesce: bool = False
+    ) -> None:
+        """
+        Serialize a message payload and send it as a text frame.
+
+        Sends go out in order through a per-client outbox. While a send is in
+        flight, later messages wait in the outbox and the caller returns
+        immediately, so a slow client never stalls the producer. With
+        ``coalesce``, a message replaces a queued one of the same type that
+        has not been sent yet; progress updates only need the latest value.
+        """
         if client_id not in self.active_connections:
             logger.warning(f"Cannot send message: client_id={client_id} not connected")
             return
 
-        websocket = self.active_connections[client_id]
+        outbox = self._outboxes.setdefault(client_id, deque())
+        if coalesce and outbox and outbox[-1]["type"] == payload["type"]:
+            outbox[-1] = payload
+        else:
+            outbox.append(payload)
 
+        if self._draining.get(client_id) is outbox:
+            return
+
+        websocket = self.active_connections[client_id]
+        self._draining[client_id] = outbox
         try:
-            await websocket.send_json(jsonable_encoder(message))
+            # Stop once a disconnect or reconnect has replaced this outbox
+            while outbox and self._outboxes.get(client_id) is outbox:
+                await websocket.send_text(_dumps(outbox.popleft()))
         except Exception as e:
             logger.exception(f"Failed to send message to client_id={client_id}: {e}")
-            await self.disconnect(client_id)
+            # Only tear down the connection this drain was sending to
+            if self.active_connections.get(client_id) is websocket:
+                await self.disconnect(client_id)
+        finally:
+            if self._draining.get(client_id) is outbox:
+                del self._draining[client_id]
 
     def register_task(self, client_id: str, task: asyncio.Task) -> None:
         """Register a task associated with a client connection."""
@@ -5,6 +5,7 @@ from typing import Iterable
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import numpy as np
+import torch
 from PIL import Image
 import sys
 # Ensure backend directory is in path
@@ -49,10 +50,11 @@ def _visualize(
             )
         )
 
-        mask_np = mask.squeeze().numpy().astype(bool)
-        overlay = np.zeros((*mask_np.shape, 4), dtype=np.float32)
+        # Bool masks convert without a copy; astype(bool) would duplicate them
+        mask_np = mask.squeeze().to(torch.bool).contiguous().numpy()
+        overlay = np.empty((*mask_np.shape, 4), dtype=np.float32)
         overlay[..., 0:3] = color[0:3]
-        overlay[..., 3] = mask_np * 0.4
+        np.multiply(mask_np, 0.4, out=overlay[..., 3])
         ax.imshow(overlay)
 
         ax.text(
@@ -1,91 +1,135 @@
 """Error handlers for FastAPI application."""
 
 import traceback
-from datetime import datetime
 from typing import Any, Dict
 
 from fastapi import Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from loguru import logger
 from pydantic import ValidationError
 
+from app.config import settings
 from app.models.schemas import ErrorResponse
 from app.utils.exceptions import (
-    NotFoundException,
-    ProcessingException,
     SAM3ServiceException,
     ServiceUnavailableException,
-    ValidationException,
 )
 
 
+# Raw request bodies are echoed back in validation errors only as a short
+# preview; parsed bodies are dropped once the request itself is this large.
+BODY_PREVIEW_BYTES = 256
+MAX_ECHOED_BODY_BYTES = 64 * 1024
+
+
+def _body_preview(request: Request, body: Any) -> Any:
+    """Bound how much of a rejected request body is copied into the response."""
+    if isinstance(body, (bytes, bytearray, str)):
+        if len(body) <= BODY_PREVIEW_BYTES:
+            return body
+        marker = "...<truncated>"
+        if isinstance(body, (bytes, bytearray)):
+            # Decode so a cut through a multi-byte character cannot break
+            # JSON serialization of the error response
+            preview = bytes(body[:BODY_PREVIEW_BYTES]).decode("utf-8", "replace")
+            return preview + marker
+        return body[:BODY_PREVIEW_BYTES] + marker
+
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit():
+        if int(content_length) > MAX_ECHOED_BODY_BYTES:
+            return None
+    return body
+
+
+def _error_response(
+    error_response: ErrorResponse,
+    status_code: int,
+    headers: Dict[str, str] | None = None,
+) -> Response:
+    """
+    Serialize an ErrorResponse straight to JSON bytes with pydantic-core.
+
+    Validation error contexts can carry exception objects; ``fallback=str``
+    renders those as their message instead of failing the error response.
+    """
+    return Response(
+        content=error_response.model_dump_json(fallback=str),
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers,
+    )
+
+
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> Response:
     """
     Handle FastAPI validation errors (422).
     
     Converts Pydantic validation errors to standardized 400 responses.
     """
     request_id = getattr(request.state, "request_id", "unknown")
+    errors = exc.errors()
     
+    # Positional arguments stay out of record["extra"]; the enqueued sinks
+    # pickle extra, and validation inputs (e.g. spooled uploads) may not pickle.
     logger.warning(
-        f"Validation error: request_id={request_id}, "
-        f"path={request.url.path}, errors={exc.errors()}"
+        "Validation error: request_id={}, path={}, errors={}",
+        request_id,
+        request.url.path,
+        errors,
     )
     
     error_details = {
-        "validation_errors": exc.errors(),
-        "body": exc.body if hasattr(exc, "body") else None,
+        "validation_errors": errors,
+        "body": _body_preview(request, getattr(exc, "body", None)),
     }
     
-    error_response = ErrorResponse(
+    # Every field is produced here, so skip re-validating the error envelope
+    error_response = ErrorResponse.model_construct(
         error="Validation Error",
         detail="Request validation failed. Check the validation_errors field for details.",
         request_id=request_id,
-        timestamp=datetime.utcnow(),
         details=error_details,
     )
     
-    return JSONResponse(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        content=error_response.model_dump(mode="json"),
-    )
+    return _error_response(error_response, status.HTTP_400_BAD_REQUEST)
 
 
 async def pydantic_validation_exception_handler(
     request: Request, exc: ValidationError
-) -> JSONResponse:
+) -> Response:
     """
     Handle Pydantic validation errors.
     
     Converts Pydantic validation errors to standardized 400 responses.
     """
     request_id = getattr(request.state, "request_id", "unknown")
+    # ValidationError.errors() rebuilds its list on every call
+    errors = exc.errors()
     
     logger.warning(
-        f"Pydantic validation error: request_id={request_id}, "
-        f"path={request.url.path}, errors={exc.errors()}"
+        "Pydantic validation error: request_id={}, path={}, errors={}",
+        request_id,
+        request.url.path,
+        errors,
     )
     
-    error_response = ErrorResponse(
+    error_response = ErrorResponse.model_construct(
         error="Validation Error",
         detail="Data validation failed",
         request_id=request_id,
-        timestamp=datetime.utcnow(),
-        details={"validation_errors": exc.errors()},
+        details={"validation_errors": errors},
     )
     
-    return JSONResponse(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        content=error_response.model_dump(mode="json"),
-    )
+    return _error_response(error_response, status.HTTP_400_BAD_REQUEST)
 
 
 async def sam3_service_exception_handler(
     request: Request, exc: SAM3ServiceException
-) -> JSONResponse:
+) -> Response:
     """
     Handle custom SAM3 service exceptions.
     
@@ -93,22 +137,19 @@ async def sam3_service_exception_handler(
     """
     request_id = getattr(request.state, "request_id", "unknown")
     
-    if exc.status_code >= 500:
-        logger.error(
-            f"SAM3 service exception: request_id={request_id}, "
-            f"status={exc.status_code}, error={exc.message}"
-        )
-    else:
-        logger.warning(
-            f"SAM3 service exception: request_id={request_id}, "
-            f"status={exc.status_code}, error={exc.message}"
-        )
+    logger.log(
+        "ERROR" if exc.status_code >= 500 else "WARNING",
+        "SAM3 service exception: request_id={request_id}, "
+        "status={status}, error={error}",
+        request_id=request_id,
+        status=exc.status_code,
+        error=exc.message,
+    )
     
     error_response = ErrorResponse(
-        error=exc.__class__.__name__.replace("Exception", " Error"),
+        error=exc.error_title,
         detail=exc.message,
         request_id=request_id,
-        timestamp=datetime.utcnow(),
         details=exc.details,
     )
     
@@ -116,41 +157,37 @@ async def sam3_service_exception_handler(
     if isinstance(exc, ServiceUnavailableException) and exc.retry_after:
         headers["Retry-After"] = str(exc.retry_after)
     
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=error_response.model_dump(mode="json"),
-        headers=headers,
-    )
+    return _error_response(error_response, exc.status_code, headers=headers)
 
 
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(request: Request, exc: Exception) -> Response:
     """
     Handle unexpected exceptions.
     
-    Logs full stack trace and returns generic 500 error to client.
+    Logs full stack trace and returns generic 500 error to client. The
+    traceback is only echoed in the response body when ``settings.debug`` is on.
     """
     request_id = getattr(request.state, "request_id", "unknown")
     
     logger.exception(
-        f"Unhandled exception: request_id={request_id}, "
-        f"path={request.url.path}, error={str(exc)}"
+        "Unhandled exception: request_id={request_id}, path={path}, error={error}",
+        request_id=request_id,
+        path=request.url.path,
+        error=str(exc),
     )
     
+    details: Dict[str, Any] = {"error_type": exc.__class__.__name__}
+    if settings.debug:
+        details["traceback"] = traceback.format_exc()
+
     error_response = ErrorResponse(
         error="Internal Server Error",
         detail="An unexpected error occurred. Please try again later.",
         request_id=request_id,
-        timestamp=datetime.utcnow(),
-        details={
-            "error_type": exc.__class__.__name__,
-            "traceback": traceback.format_exc(),
-        },
+        details=details,
     )
     
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response.model_dump(mode="json"),
-    )
+    return _error_response(error_response, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 def register_error_handlers(app) -> None:
@@ -162,10 +199,8 @@ def register_error_handlers(app) -> None:
     """
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
     app.add_exception_handler(ValidationError, pydantic_validation_exception_handler)
-    app.add_exception_handler(ValidationException, sam3_service_exception_handler)
-    app.add_exception_handler(NotFoundException, sam3_service_exception_handler)
-    app.add_exception_handler(ProcessingException, sam3_service_exception_handler)
-    app.add_exception_handler(ServiceUnavailableException, sam3_service_exception_handler)
+    # Starlette resolves handlers along the exception's MRO, so the base
+    # class covers every SAM3ServiceException subclass.
     app.add_exception_handler(SAM3ServiceException, sam3_service_exception_handler)
     app.add_exception_handler(Exception, generic_exception_handler)
     
@@ -1,11 +1,23 @@
 """Custom exception classes for the application."""
 
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Optional
 
 
 class SAM3ServiceException(Exception):
     """Base exception for SAM3 service errors."""
 
+    # BaseException only allocates its instance __dict__ on first use, so
+    # keeping every attribute in slots leaves it unallocated.
+    __slots__ = ("message", "status_code", "details")
+
+    # Title used as the "error" field of API responses
+    error_title: ClassVar[str] = "SAM3Service Error"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "error_title" not in cls.__dict__:
+            cls.error_title = cls.__name__.replace("Exception", " Error")
+
     def __init__(
         self,
         message: str,
@@ -21,6 +33,8 @@ class SAM3ServiceException(Exception):
 class ValidationException(SAM3ServiceException):
     """Exception for validation errors (400)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message, status_code=400, details=details)
 
@@ -28,6 +42,8 @@ class ValidationException(SAM3ServiceException):
 class NotFoundException(SAM3ServiceException):
     """Exception for resource not found errors (404)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message, status_code=404, details=details)
 
@@ -35,6 +51,8 @@ class NotFoundException(SAM3ServiceException):
 class ProcessingException(SAM3ServiceException):
     """Exception for processing errors (500)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message, status_code=500, details=details)
 
@@ -42,6 +60,8 @@ class ProcessingException(SAM3ServiceException):
 class ServiceUnavailableException(SAM3ServiceException):
     """Exception for service unavailable errors (503)."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self,
         message: str,
@@ -1,10 +1,21 @@
 import asyncio
+import fnmatch
+import functools
 import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, List, Union
 
+import orjson
+
 from app.config import settings
 
+# JSON file I/O gets its own small pool so it never queues behind sync route
+# handlers and model loading on the loop's default executor.
+_json_io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="json-io")
+
 
 def ensure_directories() -> None:
     """Create required directories if they don't exist."""
@@ -14,41 +25,81 @@ def ensure_directories() -> None:
 
 async def read_json_async(path: Union[str, Path]) -> Any:
     """Read and parse a JSON file asynchronously."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, _read_json_sync, path)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_json_io_executor, _read_json_sync, path)
 
 
 def _read_json_sync(path: Union[str, Path]) -> Any:
     """Synchronous helper for reading JSON."""
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
 
 
 async def write_json_async(path: Union[str, Path], data: Any, indent: int = 2) -> None:
     """Serialize and write data to a JSON file asynchronously."""
-    loop = asyncio.get_event_loop()
-    await loop.run_in_executor(None, _write_json_sync, path, data, indent)
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_json_io_executor, _write_json_sync, path, data, indent)
 
 
 def _write_json_sync(path: Union[str, Path], data: Any, indent: int) -> None:
-    """Synchronous helper for writing JSON."""
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
+    """
+    Synchronous helper for writing JSON.
+
+    orjson covers compact output and the default two-space indent; any other
+    indent width goes through the stdlib encoder.
+    """
+    if indent in (None, 0, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        payload = orjson.dumps(data, option=option)
+    else:
+        payload = json.dumps(data, indent=indent, ensure_ascii=False).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(payload)
 
 
 async def glob_async(path: Path, pattern: str) -> List[Path]:
     """Glob a directory asynchronously."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, list, path.glob(pattern))
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _glob_sync, path, pattern)
+
+
+def _glob_sync(path: Path, pattern: str) -> List[Path]:
+    """
+    Synchronous helper for globbing.
+
+    Single-component patterns are matched against one ``os.scandir`` pass;
+    recursive or multi-component patterns fall back to ``Path.glob``.
+    """
+    if "**" in pattern or "/" in pattern or os.sep in pattern:
+        return list(path.glob(pattern))
+
+    match = re.compile(fnmatch.translate(pattern)).match
+    try:
+        with os.scandir(path) as entries:
+            return [path / entry.name for entry in entries if match(entry.name)]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+@functools.lru_cache(maxsize=16)
+def _resolve_base(base: Path) -> Path:
+    """Resolve an absolute base directory once; bases are a small fixed set."""
+    return base.resolve()
 
 
 def safe_join(base: Path, *paths: str) -> Path:
     """
     Safely join a base path with one or more path components.
     Ensures the resulting path is contained within the base path.
+
+    The joined path is always fully resolved so symlinks cannot escape the
+    base; only the base's own resolution is cached (relative bases depend on
+    the working directory and are resolved every time).
     """
     final_path = (base.joinpath(*paths)).resolve()
-    base_resolved = base.resolve()
+    base_resolved = _resolve_base(base) if base.is_absolute() else base.resolve()
 
     if not final_path.is_relative_to(base_resolved):
         raise ValueError(f"Path traversal detected: {final_path} is not within {base_resolved}")
@@ -6,24 +6,29 @@ from app.config import settings
 
 
 def setup_logging() -> None:
-    """Configure loguru based on settings."""
+    """
+    Configure loguru based on settings.
+
+    Records are handed to loguru's background worker (``enqueue=True``) so
+    request handlers never block on the stdout write. Extended tracebacks and
+    variable dumps are only collected in debug mode.
+    """
     logger.remove()
     
     log_level = settings.log_level.upper()
+    sink_options = {
+        "level": log_level,
+        "enqueue": True,
+        "backtrace": settings.debug,
+        "diagnose": settings.debug,
+    }
     
     if settings.log_format == "json":
-        logger.add(
-            sys.stdout,
-            level=log_level,
-            serialize=True,
-            backtrace=True,
-            diagnose=True,
-        )
+        logger.add(sys.stdout, serialize=True, **sink_options)
     else:
         logger.add(
             sys.stdout,
-            level=log_level,
             format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | <level>{message}</level>",
-            backtrace=True,
-            diagnose=True,
+            colorize=sys.stdout.isatty(),
+            **sink_options,
         )
@@ -1,87 +1,121 @@
 """Middleware for request logging and context management."""
 
+import os
 import time
-import uuid
-from typing import Callable
 
-from fastapi import Request, Response
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.services.metrics_service import get_metrics_service
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """
     Middleware for logging all HTTP requests with context.
 
     Adds request_id to request state and logs request/response details.
+    Implemented as a plain ASGI middleware so requests are not wrapped in
+    BaseHTTPMiddleware's extra task and streaming response proxy.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    # Metrics polling should not show up in the metrics it reports
+    UNTRACKED_PATH_PREFIXES = ("/api/v1/metrics",)
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._metrics = get_metrics_service()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and log details.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware or route handler
-
-        Returns:
-            HTTP response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Correlation ID for logs and the X-Request-ID header, not a secret;
+        # hex of 16 random bytes skips building and formatting a UUID object.
+        request_id = os.urandom(16).hex()
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
 
         start_time = time.time()
-        metrics_service = get_metrics_service()
+        metrics_service = self._metrics
 
-        should_track_metrics = not request.url.path.startswith("/api/v1/metrics")
+        should_track_metrics = not path.startswith(self.UNTRACKED_PATH_PREFIXES)
 
         if should_track_metrics:
             metrics_service.record_request()
 
         logger.info(
-            f"Request started: request_id={request_id}, "
-            f"method={request.method}, path={request.url.path}, "
-            f"client={request.client.host if request.client else 'unknown'}"
+            "Request started: request_id={request_id}, "
+            "method={method}, path={path}, client={client}",
+            request_id=request_id,
+            method=method,
+            path=path,
+            client=client[0] if client else "unknown",
         )
 
-        try:
-            response = await call_next(request)
-
-            process_time = (time.time() - start_time) * 1000
-
-            if should_track_metrics:
-                metrics_service.record_processing_time(process_time)
-
-                if 200 <= response.status_code < 400:
-                    metrics_service.record_success()
-                else:
-                    metrics_service.record_error()
-
-            logger.info(
-                f"Request completed: request_id={request_id}, "
-                f"method={request.method}, path={request.url.path}, "
-                f"status={response.status_code}, "
-                f"duration_ms={process_time:.2f}"
-            )
-
-            response.headers["X-Request-ID"] = request_id
-            response.headers["X-Process-Time"] = f"{process_time:.2f}ms"
-
-            return response
+        status_code = 500
+        process_time = 0.0
+        # Completion is recorded when the response starts; an app that fails
+        # after that point must not be counted a second time.
+        response_started = False
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code, process_time, response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                process_time = (time.time() - start_time) * 1000
+
+                if should_track_metrics:
+                    metrics_service.record_completed(process_time, status_code)
+
+                headers = list(message.get("headers", []))
+                headers.append((b"x-request-id", request_id.encode("latin-1")))
+                headers.append(
+                    (b"x-process-time", f"{process_time:.2f}ms".encode("latin-1"))
+                )
+                message["headers"] = headers
+            await send(message)
 
+        try:
+            await self.app(scope, receive, send_with_request_id)
         except Exception as exc:
             process_time = (time.time() - start_time) * 1000
 
-            if should_track_metrics:
-                metrics_service.record_processing_time(process_time)
-                metrics_service.record_error()
+            if should_track_metrics and not response_started:
+                metrics_service.record_completed(process_time, 500)
 
             logger.error(
-                f"Request failed: request_id={request_id}, "
-                f"method={request.method}, path={request.url.path}, "
-                f"duration_ms={process_time:.2f}, error={str(exc)}"
+                "Request failed: request_id={request_id}, "
+                "method={method}, path={path}, "
+                "duration_ms={duration_ms:.2f}, error={error}",
+                request_id=request_id,
+                method=method,
+                path=path,
+                duration_ms=process_time,
+                error=str(exc),
             )
 
             raise
+
+        logger.info(
+            "Request completed: request_id={request_id}, "
+            "method={method}, path={path}, "
+            "status={status}, duration_ms={duration_ms:.2f}",
+            request_id=request_id,
+            method=method,
+            path=path,
+            status=status_code,
+            duration_ms=process_time,
+        )
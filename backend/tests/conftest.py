@@ -2,6 +2,8 @@ import sys
 from pathlib import Path
 from unittest.mock import Mock, MagicMock
 
+import pytest
+
 project_root = Path(__file__).resolve().parents[1]
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
@@ -28,3 +30,18 @@ def mock_sam3_imports():
 
 if "sam3" not in sys.modules:
     mock_sam3_imports()
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    Shared test client for the full application.
+
+    The lifespan is not entered, so the SAM3 model is never loaded; modules
+    that need overrides or a running lifespan define their own ``client``.
+    """
+    from fastapi.testclient import TestClient
+
+    from app.main import create_app
+
+    return TestClient(create_app())
@@ -1,3 +1,5 @@
+from google.adk import Agent
+
 from app.agentic.analyzer import PenguinAnalyzer
 
 
@@ -92,9 +94,41 @@ def test_is_rate_limited_error_detects_resource_exhausted():
     assert PenguinAnalyzer._is_rate_limited_error(exc) is True
 
 
+def test_is_rate_limited_error_follows_cause_chain():
+    try:
+        try:
+            raise RuntimeError("Too Many Requests")
+        except RuntimeError as inner:
+            raise ValueError("agent run failed") from inner
+    except ValueError as exc:
+        assert PenguinAnalyzer._is_rate_limited_error(exc) is True
+
+    assert PenguinAnalyzer._is_rate_limited_error(ValueError("bad json")) is False
+
+
 def test_analysis_fallback_explanation_for_rate_limit():
     analyzer = PenguinAnalyzer()
     explanation = analyzer._build_analysis_fallback_explanation(
         RuntimeError("resource_exhausted")
     )
     assert "rate-limited" in explanation
+
+
+def test_system_instruction_is_built_once():
+    first = PenguinAnalyzer()._get_system_instruction()
+    second = PenguinAnalyzer()._get_system_instruction()
+
+    assert first is second
+
+
+def test_build_runner_enables_context_cache_only_when_requested():
+    agent = Agent(name="penguin_analyzer", model="gemini-2.0-flash", instruction="x")
+
+    plain = PenguinAnalyzer()._build_runner(agent)
+    cached = PenguinAnalyzer(context_cache=True)._build_runner(agent)
+
+    assert plain.app_name == cached.app_name == "PenguinAgentic"
+    assert plain.context_cache_config is None
+    assert cached.context_cache_config.ttl_seconds == (
+        PenguinAnalyzer.CONTEXT_CACHE_TTL_SECONDS
+    )
@@ -47,3 +47,11 @@ def test_retry_without_mask_when_validation_mentions_mask() -> None:
         "change shirt texture to denim",
         {},
     )
+
+
+def test_skip_mask_for_spatial_instruction_ignores_case_and_partial_words() -> None:
+    assert BriaService._should_skip_mask_for_instruction("Move it LEFT", {})
+    assert not BriaService._should_skip_mask_for_instruction("add leftover crumbs", {})
+    assert not BriaService._should_skip_mask_for_instruction(
+        None, {"edit_instruction": 3}
+    )
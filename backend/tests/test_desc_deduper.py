@@ -1,4 +1,5 @@
 
+import numpy as np
 from app.detection.desc_deduper import DescriptorDeduper
 
 def test_dedup_simple_duplicates():
@@ -37,3 +38,39 @@ def test_dedup_stopwords():
     phrases = ["a big cat", "the big cat"]
     result = deduper.dedup(phrases)
     assert len(result) == 1
+
+def test_dedup_matrix_path_matches_pairwise_path():
+    rng = np.random.default_rng(0)
+    words = ["red", "blue", "ball", "box", "dog", "cat", "big", "small", "near", "window"]
+    phrases = [
+        " ".join(rng.choice(words, size=rng.integers(1, 4)))
+        for _ in range(DescriptorDeduper.MATRIX_MIN_PHRASES * 2)
+    ]
+    phrases.append("the a of")  # no content tokens
+
+    matrix_result = DescriptorDeduper().dedup(phrases)
+    pairwise = DescriptorDeduper()
+    pairwise.MATRIX_MIN_PHRASES = len(phrases) + 1
+    assert pairwise.dedup(phrases) == matrix_result
+
+def test_dedup_semantic_uses_one_batched_encode():
+    class Embedder:
+        def __init__(self):
+            self.calls = []
+
+        def encode(self, phrases):
+            self.calls.append(list(phrases))
+            vectors = {
+                "crimson sphere": [1.0, 0.0],
+                "red ball": [0.99, 0.05],
+                "wooden table": [0.0, 1.0],
+                "blank": [0.0, 0.0],
+            }
+            return np.array([vectors[p] for p in phrases])
+
+    embedder = Embedder()
+    deduper = DescriptorDeduper(embedder=embedder, semantic_thresh=0.95)
+    phrases = ["crimson sphere", "red ball", "wooden table", "blank"]
+
+    assert deduper.dedup(phrases) == ["crimson sphere", "wooden table", "blank"]
+    assert embedder.calls == [phrases]
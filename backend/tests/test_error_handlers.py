@@ -0,0 +1,150 @@
+"""
+Tests for the application error handlers.
+"""
+
+import json
+import tempfile
+
+import pytest
+from fastapi import FastAPI
+from fastapi.exceptions import RequestValidationError
+from fastapi.testclient import TestClient
+from loguru import logger
+from pydantic import BaseModel, field_validator
+from unittest.mock import Mock, patch
+
+from app.models.schemas import ErrorResponse
+from app.utils.error_handlers import (
+    _body_preview,
+    _error_response,
+    register_error_handlers,
+    validation_exception_handler,
+)
+from app.utils.exceptions import ServiceUnavailableException
+
+
+class Payload(BaseModel):
+    value: int
+
+    @field_validator("value")
+    @classmethod
+    def reject_odd(cls, value: int) -> int:
+        if value % 2:
+            raise ValueError("value must be even")
+        return value
+
+
+@pytest.fixture
+def client():
+    """Create a minimal app with the error handlers registered."""
+    app = FastAPI()
+    register_error_handlers(app)
+
+    @app.post("/payload")
+    def post_payload(payload: Payload):
+        return {"value": payload.value}
+
+    @app.get("/unavailable")
+    def unavailable():
+        raise ServiceUnavailableException("Model loading", retry_after=5)
+
+    @app.get("/crash")
+    def crash():
+        raise RuntimeError("boom")
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_validator_error_returns_400_json(client):
+    """Test that validator exceptions in the error context still serialize."""
+    response = client.post("/payload", json={"value": 3})
+
+    assert response.status_code == 400
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    assert body["error"] == "Validation Error"
+    error = body["details"]["validation_errors"][0]
+    assert error["ctx"]["error"] == "value must be even"
+
+
+def test_malformed_body_is_truncated_in_validation_error(client):
+    """Test that a large rejected body is only echoed back as a preview."""
+    raw = '{"value": "' + "x" * 5000
+    response = client.post(
+        "/payload", content=raw, headers={"content-type": "application/json"}
+    )
+
+    assert response.status_code == 400
+    body = response.json()["details"]["body"]
+    assert body.startswith('{"value": "xxx')
+    assert body.endswith("...<truncated>")
+    assert len(body) < 300
+
+
+def test_multibyte_bytes_body_preview_still_serializes():
+    """Test that a preview cut inside a UTF-8 character still serializes."""
+    request = Mock(headers={})
+    preview = _body_preview(request, ("x" + "\u00e9" * 200).encode("utf-8"))
+
+    response = _error_response(
+        ErrorResponse(
+            error="Validation Error",
+            detail="Request validation failed",
+            request_id="test",
+            details={"body": preview},
+        ),
+        400,
+    )
+
+    assert response.status_code == 400
+    body = json.loads(response.body)["details"]["body"]
+    assert body.startswith("x" + "\u00e9" * 127)
+    assert body.endswith("\ufffd...<truncated>")
+
+
+@pytest.mark.asyncio
+async def test_validation_warning_survives_unpicklable_input():
+    """Test that an unpicklable error input still reaches an enqueued sink."""
+    messages = []
+    sink_id = logger.add(messages.append, level="WARNING", enqueue=True)
+    request = Mock(headers={})
+    request.state.request_id = "req-1"
+    request.url.path = "/payload"
+
+    try:
+        with tempfile.TemporaryFile() as spooled:
+            exc = RequestValidationError(
+                [{"type": "string_type", "loc": ("body", "prompts"), "input": spooled}]
+            )
+            response = await validation_exception_handler(request, exc)
+        await logger.complete()
+    finally:
+        logger.remove(sink_id)
+
+    assert response.status_code == 400
+    assert len(messages) == 1
+    assert "Validation error: request_id=req-1, path=/payload" in messages[0]
+
+
+def test_service_exception_keeps_retry_after_header(client):
+    """Test that service exceptions carry their status and headers."""
+    response = client.get("/unavailable")
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "5"
+    body = response.json()
+    assert body["error"] == "ServiceUnavailable Error"
+    assert body["detail"] == "Model loading"
+    assert body["timestamp"].endswith("Z")
+
+
+@pytest.mark.parametrize("debug", [False, True])
+def test_generic_error_includes_traceback_only_in_debug(client, debug):
+    """Test that 500 responses only expose the traceback in debug mode."""
+    with patch("app.utils.error_handlers.settings.debug", debug):
+        response = client.get("/crash")
+
+    assert response.status_code == 500
+    details = response.json()["details"]
+    assert details["error_type"] == "RuntimeError"
+    assert ("traceback" in details) is debug
@@ -1,18 +1,8 @@
 """Integration tests for examples endpoint."""
-import pytest
 from pathlib import Path
-from fastapi.testclient import TestClient
-from app.main import create_app
 from app.config import settings
 
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    app = create_app()
-    return TestClient(app)
-
-
 def test_examples_directory_exists():
     """Test that examples directory exists and contains files."""
     assert settings.examples_dir.exists(), f"Examples directory not found: {settings.examples_dir}"
@@ -1,5 +1,6 @@
 import pytest
 import asyncio
+import hashlib
 from pathlib import Path
 from unittest.mock import Mock, AsyncMock, patch
 import torch
@@ -56,6 +57,16 @@ class TestFileService:
         assert file_path.name == "original.png"
         assert file_path.read_bytes() == b"fake image data"
 
+    @pytest.mark.asyncio
+    async def test_save_upload_feeds_digest(self, file_service, mock_upload_file):
+        """Test that save_upload hashes the bytes it writes."""
+        digest = hashlib.blake2b(digest_size=16)
+
+        await file_service.save_upload(mock_upload_file, "digest", digest=digest)
+
+        expected = hashlib.blake2b(b"fake image data", digest_size=16)
+        assert digest.digest() == expected.digest()
+
     @pytest.mark.asyncio
     async def test_save_upload_creates_result_directory(
         self, file_service, mock_upload_file, temp_dirs
@@ -167,6 +178,46 @@ class TestFileService:
 
         assert mask_array.dtype == np.uint8
 
+    @pytest.mark.asyncio
+    async def test_save_mask_handles_half_precision(self, file_service, temp_dirs):
+        """Test that bfloat16 masks are scaled like float32 masks."""
+        result_id = "test-bf16-mask"
+        _, outputs_dir = temp_dirs
+
+        mask_tensor = torch.tensor([[1.0, 0.0], [0.5, 0.0]], dtype=torch.bfloat16)
+
+        await file_service.save_mask(mask_tensor, result_id, 0)
+
+        saved = np.array(Image.open(outputs_dir / result_id / "mask_0.png"))
+        assert saved[..., 3].tolist() == [[255, 0], [127, 0]]
+
+    @pytest.mark.asyncio
+    async def test_save_original_copies_rgb_png_upload(self, file_service, temp_dirs):
+        """Test that an RGB PNG upload is copied instead of re-encoded."""
+        uploads_dir, outputs_dir = temp_dirs
+        upload_path = uploads_dir / "original.png"
+        Image.new("RGB", (8, 8), (10, 20, 30)).save(upload_path)
+        image = Mock(spec=Image.Image)
+
+        original_path = await file_service.save_original(upload_path, image, "copied")
+
+        assert original_path == outputs_dir / "copied" / "original.png"
+        assert original_path.read_bytes() == upload_path.read_bytes()
+        image.save.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_save_original_reencodes_non_rgb_upload(self, file_service, temp_dirs):
+        """Test that RGBA or non-PNG uploads are re-encoded from the RGB image."""
+        uploads_dir, outputs_dir = temp_dirs
+        upload_path = uploads_dir / "original.png"
+        Image.new("RGBA", (8, 8)).save(upload_path)
+        image = Image.new("RGB", (8, 8), (1, 2, 3))
+
+        original_path = await file_service.save_original(upload_path, image, "encoded")
+
+        with Image.open(original_path) as saved:
+            assert saved.mode == "RGB"
+
     def test_get_result_path(self, file_service, temp_dirs):
         """Test getting result file path."""
         result_id = "test-result-path"
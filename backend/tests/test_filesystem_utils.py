@@ -1,7 +1,33 @@
 import json
+from unittest.mock import patch
 
 import pytest
-from app.utils.filesystem import glob_async, read_json_async, write_json_async
+from app.utils import filesystem
+from app.utils.filesystem import (
+    ensure_directories,
+    glob_async,
+    read_json_async,
+    safe_join,
+    write_json_async,
+)
+
+
+def test_ensure_directories_recreates_removed_directory(tmp_path):
+    # Setup
+    uploads_dir = tmp_path / "uploads"
+    outputs_dir = tmp_path / "outputs"
+
+    # Execute
+    with patch.object(filesystem.settings, "uploads_dir", uploads_dir), patch.object(
+        filesystem.settings, "outputs_dir", outputs_dir
+    ):
+        ensure_directories()
+        outputs_dir.rmdir()
+        ensure_directories()
+
+    # Verify
+    assert uploads_dir.is_dir()
+    assert outputs_dir.is_dir()
 
 
 @pytest.mark.asyncio
@@ -35,6 +61,24 @@ async def test_write_json_async(tmp_path):
     assert content == data
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("indent", [2, 4, None])
+async def test_write_json_async_keeps_unicode_and_indent(tmp_path, indent):
+    # Setup
+    test_file = tmp_path / "output.json"
+    data = {"caption": "café ☕", "ids": {1: "one"}}
+
+    # Execute
+    await write_json_async(test_file, data, indent=indent)
+
+    # Verify
+    text = test_file.read_text(encoding="utf-8")
+    assert "café ☕" in text
+    assert json.loads(text) == {"caption": "café ☕", "ids": {"1": "one"}}
+    if indent:
+        assert "\n" + " " * indent + '"caption"' in text
+
+
 @pytest.mark.asyncio
 async def test_glob_async(tmp_path):
     # Setup
@@ -49,3 +93,38 @@ async def test_glob_async(tmp_path):
     assert len(txt_files) == 2
     names = sorted([f.name for f in txt_files])
     assert names == ["file1.txt", "file2.txt"]
+
+
+
+@pytest.mark.asyncio
+async def test_glob_async_recursive_and_missing_dir(tmp_path):
+    # Setup
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "mask_0.png").touch()
+    (tmp_path / "mask_1.png").touch()
+
+    # Execute
+    flat = await glob_async(tmp_path, "mask_*.png")
+    recursive = await glob_async(tmp_path, "**/mask_*.png")
+    missing = await glob_async(tmp_path / "missing", "*.png")
+
+    # Verify
+    assert [f.name for f in flat] == ["mask_1.png"]
+    assert sorted(f.name for f in recursive) == ["mask_0.png", "mask_1.png"]
+    assert missing == []
+
+
+def test_safe_join_rejects_traversal_and_symlink_escape(tmp_path):
+    # Setup
+    base = tmp_path / "outputs"
+    (base / "result").mkdir(parents=True)
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (base / "link").symlink_to(outside)
+
+    # Execute / Verify
+    assert safe_join(base, "result") == (base / "result").resolve()
+    with pytest.raises(ValueError):
+        safe_join(base, "..", "outside")
+    with pytest.raises(ValueError):
+        safe_join(base, "link")
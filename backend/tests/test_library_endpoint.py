@@ -5,6 +5,7 @@ from unittest.mock import Mock, AsyncMock
 from app.main import app
 from app.services.file_service import FileService
 from app.api.dependencies import get_file_service, get_sam3_model
+from app.api.routes.segmentation import _build_library_tree
 
 @pytest.fixture
 def mock_sam3_model():
@@ -52,3 +53,22 @@ def test_get_library(client, mock_file_service):
     result_1_node = next((c for c in results_node["children"] if c["name"] == "result_1"), None)
     assert result_1_node is not None
     assert result_1_node["type"] == "directory"
+
+
+def test_build_library_tree_lists_result_files(mock_file_service):
+    result_dir = mock_file_service.outputs_dir / "result_1"
+    (result_dir / "masks").mkdir()
+    (result_dir / "masks" / "mask_0.png").write_bytes(b"png")
+    (result_dir / "notes.txt").touch()
+
+    tree = _build_library_tree(mock_file_service)
+
+    results_node = tree.children[0]
+    result_1_node = results_node.children[0]
+    assert result_1_node.path == "/results/result_1"
+    # Directories first, and only library file types are listed
+    assert [c.name for c in result_1_node.children] == ["masks", "image.png"]
+    mask_node = result_1_node.children[0].children[0]
+    assert mask_node.url == "/outputs/result_1/masks/mask_0.png"
+    assert mask_node.size == 3
+    assert mask_node.extension == "png"
@@ -0,0 +1,29 @@
+"""
+Tests for the metrics service.
+"""
+
+import pytest
+
+from app.services.metrics_service import get_metrics_service
+
+
+@pytest.fixture
+def metrics_service():
+    """Return the shared metrics service with a clean slate."""
+    service = get_metrics_service()
+    service.reset()
+    yield service
+    service.reset()
+
+
+def test_record_completed_counts_outcome_and_duration(metrics_service):
+    """Test that one call records both the duration and the outcome."""
+    for status_code, duration_ms in [(200, 10.0), (302, 20.0), (404, 30.0), (500, 40.0)]:
+        metrics_service.record_request()
+        metrics_service.record_completed(duration_ms, status_code)
+
+    metrics = metrics_service.get_metrics()
+    assert metrics["requests_total"] == 4
+    assert metrics["requests_success"] == 2
+    assert metrics["requests_failed"] == 2
+    assert metrics["avg_processing_time_ms"] == 25.0
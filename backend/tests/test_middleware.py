@@ -0,0 +1,97 @@
+"""
+Tests for the request logging middleware.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.utils.middleware import RequestLoggingMiddleware
+
+
+@pytest.fixture
+def client():
+    """Create a minimal app wrapped in the logging middleware."""
+    app = FastAPI()
+    app.add_middleware(RequestLoggingMiddleware)
+
+    @app.get("/echo")
+    def echo(request: Request):
+        return {"request_id": request.state.request_id}
+
+    return TestClient(app)
+
+
+def test_request_id_is_shared_with_handler_and_header(client):
+    """Test that the handler sees the same request_id the response reports."""
+    response = client.get("/echo")
+
+    assert response.status_code == 200
+    request_id = response.headers["x-request-id"]
+    assert response.json() == {"request_id": request_id}
+    assert len(request_id) == 32
+    assert response.headers["x-process-time"].endswith("ms")
+
+
+def test_each_request_gets_a_new_id(client):
+    """Test that request IDs are not reused across requests."""
+    first = client.get("/echo").headers["x-request-id"]
+    second = client.get("/echo").headers["x-request-id"]
+
+    assert first != second
+
+
+def test_metrics_endpoints_are_not_tracked():
+    """Test that requests to the metrics API are left out of the metrics."""
+    metrics_service = Mock()
+    app = FastAPI()
+    app.add_middleware(RequestLoggingMiddleware)
+
+    @app.get("/api/v1/metrics")
+    def metrics():
+        return {}
+
+    @app.get("/echo")
+    def echo():
+        return {}
+
+    with patch(
+        "app.utils.middleware.get_metrics_service", return_value=metrics_service
+    ):
+        client = TestClient(app)
+        client.get("/api/v1/metrics")
+        client.get("/echo")
+
+    metrics_service.record_request.assert_called_once()
+    metrics_service.record_completed.assert_called_once()
+    assert metrics_service.record_completed.call_args[0][1] == 200
+
+
+@pytest.mark.asyncio
+async def test_failure_after_response_start_is_recorded_once():
+    """Test that an app raising mid-response is only counted once."""
+    metrics_service = Mock()
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        raise RuntimeError("stream broke")
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    scope = {"type": "http", "method": "GET", "path": "/stream", "client": None}
+    with patch(
+        "app.utils.middleware.get_metrics_service", return_value=metrics_service
+    ):
+        middleware = RequestLoggingMiddleware(app)
+
+    with pytest.raises(RuntimeError):
+        await middleware(scope, receive, send)
+
+    metrics_service.record_completed.assert_called_once()
+    assert metrics_service.record_completed.call_args[0][1] == 200
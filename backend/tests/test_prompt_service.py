@@ -0,0 +1,35 @@
+from unittest.mock import Mock
+
+from app.detection.types import PromptTier
+from app.services.prompt_service import PromptPipeline
+
+
+def _pipeline():
+    refiner = Mock()
+    refiner.refine = Mock(side_effect=lambda raw, spec: spec)
+    return PromptPipeline(refiner=refiner), refiner
+
+
+def test_build_from_objects_reuses_plans_for_identical_metadata():
+    pipeline, refiner = _pipeline()
+    obj = {"label": "mug", "description": "A red mug. On a table.", "texture": "glossy"}
+
+    first = pipeline.build_from_objects([obj])
+    second = pipeline.build_from_objects([dict(reversed(list(obj.items())))])
+
+    assert refiner.refine.call_count == 1
+    assert [(p.tier, p.text) for p in second[0].plans] == [
+        (p.tier, p.text) for p in first[0].plans
+    ]
+    assert second[0].plans[0] is not first[0].plans[0]
+    assert second[0].plans[0].tier in (PromptTier.CORE, PromptTier.CORE_VISUAL)
+
+
+def test_build_from_objects_cache_is_bounded():
+    pipeline, refiner = _pipeline()
+    pipeline.PLAN_CACHE_SIZE = 1
+
+    for label in ["mug", "plate", "mug"]:
+        pipeline.build_from_objects([{"label": label, "description": label}])
+
+    assert refiner.refine.call_count == 3
@@ -36,9 +36,22 @@ class TestSAM3Model:
         assert sam3_model.box_threshold == 0.15
         assert sam3_model.text_threshold == 0.22
         assert sam3_model.iou_threshold == 0.45
+        assert sam3_model.compile_model is False
+        assert sam3_model.mixed_precision is False
         assert sam3_model.is_loaded is False
         assert sam3_model.processor is None
 
+    def test_autocast_only_applies_to_cuda(self, sam3_model):
+        """Test that CPU inference keeps full precision."""
+        with sam3_model._autocast():
+            assert not torch.is_autocast_enabled()
+
+        cuda_model = SAM3Model(
+            device="cuda", confidence_threshold=0.5, mixed_precision=False
+        )
+        with cuda_model._autocast():
+            assert not torch.is_autocast_enabled()
+
     def test_get_health_status_before_load(self, sam3_model):
         """Test health status before model is loaded."""
         status = sam3_model.get_health_status()
@@ -59,6 +72,21 @@ class TestSAM3Model:
             assert sam3_model.processor is not None
             assert sam3_model._load_error is None
 
+    @pytest.mark.asyncio
+    async def test_load_warms_up_cuda_model(self, mock_processor):
+        """Test that loading on CUDA runs one warmup detection."""
+        model = SAM3Model(device="cuda", confidence_threshold=0.5)
+        with patch.object(
+            model, "_load_sam3_processor", return_value=mock_processor
+        ), patch.object(model, "detect") as mock_detect:
+            await model.load()
+
+        mock_detect.assert_called_once()
+        image, prompts = mock_detect.call_args[0]
+        assert image.size == (model.WARMUP_IMAGE_SIZE, model.WARMUP_IMAGE_SIZE)
+        assert prompts == [model.WARMUP_PROMPT]
+        assert model.is_loaded is True
+
     @pytest.mark.asyncio
     async def test_load_failure(self, sam3_model):
         """Test model loading failure."""
@@ -145,6 +173,28 @@ class TestSAM3Model:
         assert len(result.labels) == 2
         assert result.labels[0] == "person"
         assert result.labels[1] == "car"
+        mock_processor.set_image.assert_called_once_with(image)
+
+    def test_detect_reuses_encoded_image_state(self, sam3_model, mock_processor):
+        """Test that a pre-encoded image state skips the image encoder."""
+        sam3_model.processor = mock_processor
+        sam3_model.is_loaded = True
+
+        image = Image.new("RGB", (640, 480))
+        state = {
+            "boxes": torch.tensor([[10.0, 20.0, 100.0, 200.0]]),
+            "scores": torch.tensor([0.95]),
+            "masks": torch.ones((1, 1, 480, 640), dtype=torch.bool),
+        }
+        mock_processor.set_image.return_value = state
+        mock_processor.set_text_prompt.return_value = state
+
+        image_state = sam3_model.encode_image(image)
+        sam3_model.detect(image, ["person"], image_state=image_state)
+        sam3_model.detect(image, ["car"], image_state=image_state)
+
+        mock_processor.set_image.assert_called_once_with(image)
+        assert mock_processor.reset_all_prompts.call_count == 2
 
     def test_detect_with_no_detections(self, sam3_model, mock_processor):
         """Test detection when no objects are found."""
@@ -191,6 +241,39 @@ class TestSAM3Model:
 
         assert mock_processor.set_text_prompt.call_count == 2
 
+    def test_text_encoder_cache_reuses_prompt_embeddings(self, sam3_model):
+        """Test that repeated prompts skip the text encoder."""
+        backbone = Mock()
+        encode_text = Mock(
+            side_effect=lambda captions, **kwargs: {"language_features": captions[0]}
+        )
+        backbone.forward_text = encode_text
+        sam3_model._cache_text_encoder(backbone)
+
+        first = backbone.forward_text(["person"], device="cpu")
+        second = backbone.forward_text(["person"], device="cpu")
+        backbone.forward_text(["car"], device="cpu")
+
+        assert first == second == {"language_features": "person"}
+        assert encode_text.call_count == 2
+
+    def test_text_encoder_cache_evicts_least_recent_prompt(self, sam3_model):
+        """Test that the cache is bounded by TEXT_EMBEDDING_CACHE_SIZE."""
+        backbone = Mock()
+        encode_text = Mock(
+            side_effect=lambda captions, **kwargs: {"language_features": captions[0]}
+        )
+        backbone.forward_text = encode_text
+        sam3_model.TEXT_EMBEDDING_CACHE_SIZE = 2
+        sam3_model._cache_text_encoder(backbone)
+
+        for prompt in ["a", "b", "a", "c", "a", "b"]:
+            backbone.forward_text([prompt], device="cpu")
+
+        # "b" was evicted when "c" arrived; "a" stayed hot throughout
+        encoded = [call.args[0][0] for call in encode_text.call_args_list]
+        assert encoded == ["a", "b", "c", "b"]
+
     def test_detect_handles_processor_error(self, sam3_model, mock_processor):
         """Test that detection errors are properly handled."""
         sam3_model.processor = mock_processor
@@ -3,21 +3,12 @@ Tests for scene parsing API routes.
 """
 
 import pytest
-from fastapi.testclient import TestClient
 from unittest.mock import Mock, patch
 
-from app.main import create_app
-
 
 class TestSceneParsingRoutes:
     """Test cases for scene parsing API routes."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        app = create_app()
-        return TestClient(app)
-    
     @pytest.fixture
     def mock_service(self):
         """Mock scene parsing service."""
@@ -1,44 +1,10 @@
-import sys
-from unittest.mock import MagicMock
 import warnings
 
-# Mock heavy modules before imports
-def mock_module(name):
-    if name not in sys.modules:
-        sys.modules[name] = MagicMock()
-
-modules_to_mock = [
-    "torch",
-    "torch.nn",
-    "torch.nn.functional",
-    "torchvision",
-    "cv2",
-    "skimage",
-    "transformers",
-    "google-adk",
-    "sentence_transformers",
-    "accelerate",
-    "sam3",
-    "sam3.model",
-    "sam3.model.sam3_image_processor",
-    "triton",
-    "spacy",
-    "einops",
-    "decord",
-    "pycocotools",
-    "psutil",
-    "matplotlib",
-    "pandas",
-    "scikit-learn"
-]
-
-for mod in modules_to_mock:
-    mock_module(mod)
-
 # Suppress ResourceWarning for mocked sockets if any
 warnings.simplefilter("ignore", ResourceWarning)
 
 import pytest
+from unittest.mock import MagicMock
 from pathlib import Path
 from fastapi.testclient import TestClient
 from app.main import create_app
@@ -1,12 +1,17 @@
+import hashlib
 import json
+import threading
+from io import BytesIO
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 import torch
+from fastapi import UploadFile
 from PIL import Image
 
 from app.detection.types import DetectionResult, PromptTier
 from app.models.sam3_model import SAM3Model
+from app.models.schemas import BoundingBox, MaskMetadata
 from app.services.file_service import FileService
 from app.services.prompt_service import PromptPlan, PromptPlanSet
 from app.services.segmentation_service import SegmentationService
@@ -72,18 +77,17 @@ class TestSegmentationService:
 
     @pytest.fixture
     def segmentation_service(self, mock_sam3_model, mock_file_service, prompt_pipeline):
-        return SegmentationService(
+        service = SegmentationService(
             sam3_model=mock_sam3_model,
             file_service=mock_file_service,
             prompt_pipeline=prompt_pipeline,
         )
+        yield service
+        service.shutdown()
 
     @pytest.fixture
     def mock_upload_file(self):
-        mock_file = Mock()
-        mock_file.filename = "test_image.png"
-        mock_file.read = AsyncMock(return_value=b"fake image data")
-        return mock_file
+        return UploadFile(filename="test_image.png", file=BytesIO(b"fake image data"))
 
     @pytest.fixture
     def mock_detection_result(self):
@@ -137,6 +141,104 @@ class TestSegmentationService:
         assert response.processing_time_ms > 0
         mock_sam3_model.detect.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_process_segmentation_runs_detection_on_inference_thread(
+        self,
+        segmentation_service,
+        mock_upload_file,
+        mock_sam3_model,
+        mock_file_service,
+        mock_detection_result,
+        tmp_path,
+    ):
+        detect_threads = []
+
+        def detect(*args, **kwargs):
+            detect_threads.append(threading.current_thread().name)
+            return mock_detection_result
+
+        mock_file_service.save_upload = AsyncMock(
+            return_value=tmp_path / "uploads" / "original.png"
+        )
+        mock_file_service.save_mask = AsyncMock(return_value="/outputs/x/mask_0.png")
+        mock_sam3_model.detect = Mock(side_effect=detect)
+
+        with patch("app.services.segmentation_service.Image.open") as mock_open:
+            mock_open.return_value = Mock(spec=Image.Image)
+            await segmentation_service.process_segmentation(
+                image_file=mock_upload_file, metadata_file=None, prompts=["person"]
+            )
+
+        assert detect_threads
+        assert all(name.startswith("sam3-inference") for name in detect_threads)
+
+    @pytest.mark.asyncio
+    async def test_process_segmentation_streams_upload_into_output_dir(
+        self,
+        segmentation_service,
+        mock_sam3_model,
+        mock_file_service,
+        mock_detection_result,
+        tmp_path,
+    ):
+        output_dir = tmp_path / "generation"
+        image_bytes = b"\x89PNG fake image payload" * 100
+        image_file = UploadFile(filename="generated.png", file=BytesIO(image_bytes))
+
+        mock_file_service.save_mask = AsyncMock(return_value="/outputs/generation/mask_0.png")
+        mock_sam3_model.detect = Mock(return_value=mock_detection_result)
+
+        with patch("app.services.segmentation_service.Image.open") as mock_open:
+            mock_open.return_value = Mock(spec=Image.Image)
+            await segmentation_service.process_segmentation(
+                image_file=image_file,
+                metadata_file=None,
+                prompts=["person"],
+                output_dir=output_dir,
+            )
+
+        assert (output_dir / "original.png").read_bytes() == image_bytes
+        assert image_file.file.tell() == 0
+        mock_file_service.save_upload.assert_not_called()
+        # The cache key is the digest taken while copying the upload
+        expected = hashlib.blake2b(image_bytes, digest_size=16).digest()
+        assert list(segmentation_service._decoded_images) == [expected]
+
+    def test_decode_image_reuses_decode_for_identical_upload(
+        self, segmentation_service, tmp_path
+    ):
+        image_path = tmp_path / "original.png"
+        Image.new("RGB", (4, 4), (5, 6, 7)).save(image_path)
+        digest = segmentation_service._copy_upload(
+            BytesIO(image_path.read_bytes()), tmp_path / "copy.png"
+        )
+
+        with patch(
+            "app.services.segmentation_service.Image.open", wraps=Image.open
+        ) as mock_open:
+            first = segmentation_service._decode_image(image_path, digest)
+            first.putpixel((0, 0), (255, 255, 255))
+            second = segmentation_service._decode_image(image_path, digest)
+
+        assert first is not second
+        assert second.mode == "RGB"
+        assert second.getpixel((0, 0)) == (5, 6, 7)
+        mock_open.assert_called_once_with(image_path)
+
+    def test_decode_image_cache_is_bounded_by_pixel_bytes(
+        self, segmentation_service, tmp_path
+    ):
+        image_path = tmp_path / "original.png"
+        Image.new("RGB", (4, 4)).save(image_path)
+        # Room for exactly two 4x4 RGB images
+        segmentation_service.DECODED_IMAGE_CACHE_BYTES = 2 * 4 * 4 * 3
+
+        for digest in (b"a", b"b", b"c"):
+            segmentation_service._decode_image(image_path, digest)
+
+        assert list(segmentation_service._decoded_images) == [b"b", b"c"]
+        assert segmentation_service._decoded_images_bytes == 2 * 4 * 4 * 3
+
     @pytest.mark.asyncio
     async def test_process_segmentation_with_metadata(
         self,
@@ -310,6 +412,47 @@ class TestSegmentationService:
             await segmentation_service._parse_metadata(mock_file)
         assert "Invalid JSON metadata" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_save_segmentation_meta_writes_readable_json(
+        self, segmentation_service, tmp_path
+    ):
+        source_metadata = {"objects": [{"description": "café table"}]}
+        mask = MaskMetadata(
+            mask_id="mask_0",
+            object_id="object_0",
+            label="table",
+            confidence=0.9,
+            bounding_box=BoundingBox(x1=1.0, y1=2.0, x2=3.0, y2=4.0),
+            area_pixels=4,
+            area_percentage=0.5,
+            centroid=(2, 3),
+            mask_url="/outputs/r/mask_0.png",
+        )
+
+        await segmentation_service._save_segmentation_meta(
+            tmp_path, [mask], source_metadata
+        )
+
+        saved = json.loads((tmp_path / "segmentation_meta.json").read_text(encoding="utf-8"))
+        assert saved["source_metadata"] == source_metadata
+        assert saved["masks"] == [
+            {
+                "mask_id": "mask_0",
+                "object_id": "object_0",
+                "label": "table",
+                "confidence": 0.9,
+                "bounding_box": {"x1": 1.0, "y1": 2.0, "x2": 3.0, "y2": 4.0},
+                "area_pixels": 4,
+                "area_percentage": 0.5,
+                "centroid": [2, 3],
+                "mask_url": "/outputs/r/mask_0.png",
+                "prompt_tier": None,
+                "prompt_text": None,
+                "prompt_object": None,
+                "object_metadata": None,
+            }
+        ]
+
     @pytest.mark.asyncio
     async def test_process_segmentation_handles_detection_error(
         self,
@@ -497,6 +640,33 @@ class TestSegmentationService:
         assert result.labels == []
         assert prompt_info == []
 
+    def test_run_tiered_detection_stops_at_high_confidence_plan(
+        self, segmentation_service, mock_sam3_model
+    ):
+        confident = DetectionResult(
+            boxes_xyxy=torch.tensor([[0.0, 0.0, 5.0, 5.0]]),
+            scores=torch.tensor([SegmentationService.EARLY_EXIT_CONFIDENCE]),
+            labels=["cat"],
+            masks=torch.ones((1, 1, 10, 10), dtype=torch.bool),
+        )
+        plans = PromptPlanSet(
+            label="cat",
+            plans=[
+                PromptPlan(label="cat", tier=PromptTier.CORE, text="cat"),
+                PromptPlan(label="cat", tier=PromptTier.CORE, text="a cat"),
+            ],
+        )
+        mock_sam3_model.detect = Mock(return_value=confident)
+
+        image = Mock(spec=Image.Image)
+        image.width = 10
+        image.height = 10
+
+        result, _ = segmentation_service._run_tiered_detection(image, [plans])
+
+        assert result.labels == ["cat"]
+        mock_sam3_model.detect.assert_called_once()
+
     def test_deduplicate_detection_result_merges_overlapping_masks(self, segmentation_service):
         overlapping_masks = torch.zeros((2, 1, 16, 16), dtype=torch.bool)
         overlapping_masks[0, 0, 2:10, 2:10] = True
@@ -523,6 +693,67 @@ class TestSegmentationService:
         assert deduped.masks.shape[0] == 1
         assert len(deduped_info) == 1
 
+    def test_deduplicate_detection_result_keeps_masks_when_nothing_merges(
+        self, segmentation_service
+    ):
+        masks = torch.zeros((2, 1, 16, 16), dtype=torch.bool)
+        masks[0, 0, 0:4, 0:4] = True
+        masks[1, 0, 10:14, 10:14] = True
+
+        detection = DetectionResult(
+            boxes_xyxy=torch.tensor(
+                [[0.0, 0.0, 3.0, 3.0], [10.0, 10.0, 13.0, 13.0]], dtype=torch.float32
+            ),
+            scores=torch.tensor([0.92, 0.88], dtype=torch.float32),
+            labels=["person", "person"],
+            masks=masks,
+        )
+        prompt_info = [{"object_id": "object_0"}, {"object_id": "object_1"}]
+
+        deduped, deduped_info = segmentation_service._deduplicate_detection_result(
+            detection, prompt_info
+        )
+
+        assert deduped.masks is masks
+        assert deduped_info == prompt_info
+
+    def test_mask_areas_and_centroids_batched(self, segmentation_service):
+        masks = torch.zeros((3, 1, 20, 30), dtype=torch.bool)
+        masks[0, 0, 2:6, 4:10] = True
+        masks[1, 0, 10:20, 0:30] = True
+
+        areas, centroid_x, centroid_y = segmentation_service._mask_areas_and_centroids(masks)
+
+        assert areas.tolist() == [24, 300, 0]
+        assert [int(v) for v in centroid_x.tolist()] == [6, 14, 0]
+        assert [int(v) for v in centroid_y.tolist()] == [3, 14, 0]
+
+    def test_calculate_mask_metadata_centres_empty_masks_on_box(
+        self, segmentation_service
+    ):
+        masks = torch.zeros((2, 1, 20, 30), dtype=torch.bool)
+        masks[0, 0, 2:6, 4:10] = True
+        detection = DetectionResult(
+            boxes_xyxy=torch.tensor([[4.0, 2.0, 10.0, 6.0], [11.0, 3.0, 20.0, 8.0]]),
+            scores=torch.tensor([0.9, 0.8]),
+            labels=["cat", "dog"],
+            masks=masks,
+        )
+
+        metadata = segmentation_service._calculate_mask_metadata(
+            detection, ["/m0.png", "/m1.png"], 30, 20, []
+        )
+
+        assert [(m.centroid[0], m.centroid[1]) for m in metadata] == [(6, 3), (15, 5)]
+        assert [m.area_pixels for m in metadata] == [24, 0]
+
+    def test_extract_prompt_object_cuts_at_first_listed_separator(self):
+        assert SegmentationService._extract_prompt_object("a cat on a mat with stripes") == "cat"
+        assert SegmentationService._extract_prompt_object("the dog, her collar") == "dog"
+        # " with " is listed before " on ", so it decides the cut even though
+        # " on " appears earlier in the text
+        assert SegmentationService._extract_prompt_object("a man on a horse with a hat") == "horse"
+
     @pytest.mark.asyncio
     async def test_response_includes_prompt_tier_and_text(
         self,
@@ -0,0 +1,17 @@
+from unittest.mock import patch
+
+from app.detection import semantic_parser
+from app.detection.semantic_parser import SemanticParser
+
+
+def test_parsers_share_one_loaded_pipeline():
+    semantic_parser._load_pipeline.cache_clear()
+    try:
+        with patch.object(semantic_parser.spacy, "load") as mock_load:
+            first = SemanticParser("test_model")
+            second = SemanticParser("test_model")
+
+        mock_load.assert_called_once_with("test_model")
+        assert first.nlp is second.nlp
+    finally:
+        semantic_parser._load_pipeline.cache_clear()
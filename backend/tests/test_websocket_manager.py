@@ -1,4 +1,5 @@
 import pytest
+import json
 import asyncio
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime
@@ -20,7 +21,7 @@ class TestWebSocketManager:
         """Create a mock WebSocket."""
         ws = Mock()
         ws.accept = AsyncMock()
-        ws.send_json = AsyncMock()
+        ws.send_text = AsyncMock()
         ws.close = AsyncMock()
         return ws
 
@@ -41,9 +42,9 @@ class TestWebSocketManager:
         mock_websocket.accept.assert_called_once()
         assert client_id in ws_manager.active_connections
         assert ws_manager.active_connections[client_id] == mock_websocket
-        mock_websocket.send_json.assert_called_once()
+        mock_websocket.send_text.assert_called_once()
 
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = json.loads(mock_websocket.send_text.call_args[0][0])
         assert call_args["type"] == "connected"
         assert call_args["data"]["client_id"] == client_id
 
@@ -52,11 +53,11 @@ class TestWebSocketManager:
         """Test connecting multiple clients."""
         ws1 = Mock()
         ws1.accept = AsyncMock()
-        ws1.send_json = AsyncMock()
+        ws1.send_text = AsyncMock()
 
         ws2 = Mock()
         ws2.accept = AsyncMock()
-        ws2.send_json = AsyncMock()
+        ws2.send_text = AsyncMock()
 
         await ws_manager.connect(ws1, "client-1")
         await ws_manager.connect(ws2, "client-2")
@@ -110,15 +111,80 @@ class TestWebSocketManager:
         client_id = "client-123"
 
         await ws_manager.connect(mock_websocket, client_id)
-        mock_websocket.send_json.reset_mock()
+        mock_websocket.send_text.reset_mock()
 
         await ws_manager.send_progress(client_id, 50, "Processing...")
 
-        mock_websocket.send_json.assert_called_once()
-        call_args = mock_websocket.send_json.call_args[0][0]
+        mock_websocket.send_text.assert_called_once()
+        call_args = json.loads(mock_websocket.send_text.call_args[0][0])
         assert call_args["type"] == "progress"
         assert call_args["data"]["progress"] == 50
         assert call_args["data"]["message"] == "Processing..."
+        assert isinstance(datetime.fromisoformat(call_args["timestamp"]), datetime)
+
+    @pytest.mark.asyncio
+    async def test_send_progress_coalesces_while_send_in_flight(
+        self, ws_manager, mock_websocket
+    ):
+        """Test that queued progress updates collapse to the latest one."""
+        client_id = "client-123"
+        await ws_manager.connect(mock_websocket, client_id)
+
+        release = asyncio.Event()
+        sent = []
+
+        async def slow_send(text):
+            sent.append(json.loads(text))
+            if len(sent) == 1:
+                await release.wait()
+
+        mock_websocket.send_text = slow_send
+
+        first = asyncio.create_task(ws_manager.send_progress(client_id, 10, "a"))
+        await asyncio.sleep(0)
+        await ws_manager.send_progress(client_id, 20, "b")
+        await ws_manager.send_progress(client_id, 30, "c")
+        await ws_manager.send_error(client_id, "boom")
+        release.set()
+        await first
+
+        assert [m["type"] for m in sent] == ["progress", "progress", "error"]
+        assert [m["data"].get("progress") for m in sent[:2]] == [10, 30]
+
+    @pytest.mark.asyncio
+    async def test_reconnect_during_in_flight_send_delivers_new_messages(
+        self, ws_manager, mock_websocket
+    ):
+        """Test that a reconnect does not wait on the old connection's drain."""
+        client_id = "client-123"
+        await ws_manager.connect(mock_websocket, client_id)
+
+        release = asyncio.Event()
+
+        async def stuck_send(text):
+            await release.wait()
+            raise RuntimeError("socket closed")
+
+        mock_websocket.send_text = stuck_send
+        old_send = asyncio.create_task(ws_manager.send_progress(client_id, 10, "a"))
+        await asyncio.sleep(0)
+
+        await ws_manager.disconnect(client_id)
+        new_websocket = Mock()
+        new_websocket.accept = AsyncMock()
+        new_websocket.send_text = AsyncMock()
+        new_websocket.close = AsyncMock()
+        await ws_manager.connect(new_websocket, client_id)
+        await ws_manager.send_progress(client_id, 20, "b")
+
+        sent = [json.loads(c.args[0]) for c in new_websocket.send_text.call_args_list]
+        assert [m["type"] for m in sent] == ["connected", "progress"]
+
+        # The old drain failing afterwards must not tear down the new connection
+        release.set()
+        await old_send
+        assert ws_manager.is_connected(client_id)
+        new_websocket.close.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_send_progress_to_disconnected_client(
@@ -129,7 +195,7 @@ class TestWebSocketManager:
 
         await ws_manager.send_progress(client_id, 50, "Processing...")
 
-        mock_websocket.send_json.assert_not_called()
+        mock_websocket.send_text.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_send_result(self, ws_manager, mock_websocket):
@@ -137,7 +203,7 @@ class TestWebSocketManager:
         client_id = "client-123"
 
         await ws_manager.connect(mock_websocket, client_id)
-        mock_websocket.send_json.reset_mock()
+        mock_websocket.send_text.reset_mock()
 
         bbox = BoundingBox(x1=10.0, y1=20.0, x2=100.0, y2=200.0)
         mask = MaskMetadata(
@@ -159,8 +225,8 @@ class TestWebSocketManager:
 
         await ws_manager.send_result(client_id, result)
 
-        mock_websocket.send_json.assert_called_once()
-        call_args = mock_websocket.send_json.call_args[0][0]
+        mock_websocket.send_text.assert_called_once()
+        call_args = json.loads(mock_websocket.send_text.call_args[0][0])
         assert call_args["type"] == "result"
         assert call_args["data"]["result_id"] == "test-123"
         assert len(call_args["data"]["masks"]) == 1
@@ -171,12 +237,12 @@ class TestWebSocketManager:
         client_id = "client-123"
 
         await ws_manager.connect(mock_websocket, client_id)
-        mock_websocket.send_json.reset_mock()
+        mock_websocket.send_text.reset_mock()
 
         await ws_manager.send_error(client_id, "Processing failed")
 
-        mock_websocket.send_json.assert_called_once()
-        call_args = mock_websocket.send_json.call_args[0][0]
+        mock_websocket.send_text.assert_called_once()
+        call_args = json.loads(mock_websocket.send_text.call_args[0][0])
         assert call_args["type"] == "error"
         assert call_args["data"]["error"] == "Processing failed"
 
@@ -186,7 +252,7 @@ class TestWebSocketManager:
         client_id = "client-123"
 
         await ws_manager.connect(mock_websocket, client_id)
-        mock_websocket.send_json = AsyncMock(side_effect=Exception("Send failed"))
+        mock_websocket.send_text = AsyncMock(side_effect=Exception("Send failed"))
 
         await ws_manager.send_progress(client_id, 50, "Processing...")
 
@@ -228,13 +294,13 @@ class TestWebSocketManager:
         client_id = "client-123"
 
         await ws_manager.connect(mock_websocket, client_id)
-        mock_websocket.send_json.reset_mock()
+        mock_websocket.send_text.reset_mock()
 
         await ws_manager.send_progress(client_id, 0, "Starting...")
         await ws_manager.send_progress(client_id, 50, "Processing...")
         await ws_manager.send_progress(client_id, 100, "Complete!")
 
-        assert mock_websocket.send_json.call_count == 3
+        assert mock_websocket.send_text.call_count == 3
 
     @pytest.mark.asyncio
     async def test_connect_handles_accept_error(self, ws_manager):
@@ -255,7 +321,7 @@ class TestWebSocketManager:
 
         mock_ws = Mock()
         mock_ws.accept = AsyncMock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
         mock_ws.close = AsyncMock(side_effect=Exception("Close failed"))
 
         await ws_manager.connect(mock_ws, client_id)